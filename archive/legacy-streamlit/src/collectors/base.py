@@ -74,6 +74,17 @@ class BaseCollector(ABC):
         """Whether this is a mock/fake data collector."""
         pass
 
+    @property
+    def thread_safe(self) -> bool:
+        """
+        Whether search() may be called from several threads at once.
+
+        Collectors keeping unsynchronised state (rate-limit windows, request
+        counters, a shared random generator) must leave this False so callers
+        run their searches one at a time.
+        """
+        return False
+
     @abstractmethod
     def get_rate_limit_status(self) -> dict:
         """
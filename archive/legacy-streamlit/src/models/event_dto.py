@@ -1,13 +1,18 @@
 """Event data transfer object (DTO) with dataclass implementation."""
 
 import json
+import sys
 import uuid
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import Dict, Any, List, Literal, Optional
 
+# Scans create thousands of events, so drop the per-instance __dict__ where
+# dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class EventDTO:
     """
     Event data transfer object for business logic.
@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Literal
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from src.storage import SQLiteStorage
 from src.models import EventCategory
@@ -125,7 +125,7 @@ class DigestGenerator:
         report_data = {
             "client": client,
             "total_events": len(events),
-            "high_priority": len([e for e in events if e.relevance_score >= 0.7]),
+            "high_priority": sum(1 for e in events if e.relevance_score >= 0.7),
             "by_category": self._group_by_category(events),
             "by_sentiment": self._group_by_sentiment(events),
             "recent_events": sorted(events, key=lambda e: e.published_date, reverse=True)[:10],
@@ -188,10 +188,8 @@ class DigestGenerator:
 
     def _group_by_sentiment(self, events: List) -> Dict[str, int]:
         """Group events by sentiment."""
-        positive = len([e for e in events if e.sentiment == "positive"])
-        neutral = len([e for e in events if e.sentiment == "neutral"])
-        negative = len([e for e in events if e.sentiment == "negative"])
-        return {"positive": positive, "neutral": neutral, "negative": negative}
+        counts = Counter(e.sentiment for e in events)
+        return {"positive": counts["positive"], "neutral": counts["neutral"], "negative": counts["negative"]}
 
     def _calculate_trend(self, events: List) -> str:
         """Calculate trend direction for events."""
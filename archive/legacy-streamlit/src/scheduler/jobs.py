@@ -147,8 +147,8 @@ def weekly_report_job(storage: SQLiteStorage) -> JobRun:
 
         # Calculate statistics
         total_events = len(weekly_events)
-        new_events = len([e for e in weekly_events if e.status == "new"])
-        high_relevance = len([e for e in weekly_events if e.relevance_score >= 0.7])
+        new_events = sum(1 for e in weekly_events if e.status == "new")
+        high_relevance = sum(1 for e in weekly_events if e.relevance_score >= 0.7)
 
         # Events by client
         events_by_client = {}
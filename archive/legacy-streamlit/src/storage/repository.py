@@ -79,6 +79,14 @@ class EventRepository:
         session.flush()
         return event
 
+    @staticmethod
+    def create_many(session: Session, events: List[dict]) -> List[Event]:
+        """Create several events with a single flush."""
+        created = [Event(**kwargs) for kwargs in events]
+        session.add_all(created)
+        session.flush()
+        return created
+
     @staticmethod
     def get_by_id(session: Session, event_id: int) -> Optional[Event]:
         """Get event by ID."""
@@ -8,7 +8,7 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Set, Tuple
 from datetime import datetime, timedelta
 from contextlib import contextmanager
 
@@ -21,6 +21,11 @@ from config import settings
 logger = logging.getLogger(__name__)
 
 
+def _py_lower(value: Optional[str]) -> Optional[str]:
+    """SQL function folding case like str.lower(), for non-ASCII text too."""
+    return value.lower() if isinstance(value, str) else value
+
+
 class SQLiteStorage(BaseStorage):
     """SQLite implementation of storage interface."""
 
@@ -39,6 +44,7 @@ class SQLiteStorage(BaseStorage):
             self.db_path = db_path
 
         self._connection = None
+        self._transaction_depth = 0  # > 0 while inside transaction()
         logger.info(f"SQLite storage initialized with database: {self.db_path}")
 
     # ==================== Connection Management ====================
@@ -54,6 +60,8 @@ class SQLiteStorage(BaseStorage):
             self._connection.row_factory = sqlite3.Row
             # Enable foreign keys
             self._connection.execute("PRAGMA foreign_keys = ON")
+            # SQLite's own lower()/LIKE only fold ASCII; event search folds Unicode
+            self._connection.create_function("py_lower", 1, _py_lower, deterministic=True)
             logger.info("Connected to SQLite database")
         except sqlite3.Error as e:
             logger.error(f"Failed to connect to database: {e}")
@@ -85,14 +93,51 @@ class SQLiteStorage(BaseStorage):
 
         try:
             yield self._connection
-            self._connection.commit()
+            # Inside transaction() the outermost block commits or rolls back
+            if not self._transaction_depth:
+                self._connection.commit()
         except Exception as e:
-            self._connection.rollback()
+            if not self._transaction_depth:
+                self._connection.rollback()
             logger.error(f"Database operation failed: {e}")
             raise
         finally:
             pass  # Keep connection open for reuse
 
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager grouping several storage calls into one transaction.
+
+        Everything inside the block commits together when it exits, or is
+        rolled back if it raises. Blocks may be nested; only the outermost
+        one commits.
+
+        Usage:
+            with storage.transaction():
+                storage.create_client(client)
+                storage.create_event(event)
+        """
+        if not self.is_connected():
+            self.connect()
+
+        outermost = not self._transaction_depth
+        if outermost and not self._connection.in_transaction:
+            self._connection.execute("BEGIN")
+
+        self._transaction_depth += 1
+        try:
+            yield self
+        except Exception:
+            self._transaction_depth -= 1
+            if outermost:
+                self._connection.rollback()
+            raise
+        else:
+            self._transaction_depth -= 1
+            if outermost:
+                self._connection.commit()
+
     # ==================== Database Management ====================
 
     def _migrate_schema(self, cursor) -> None:
@@ -191,6 +236,14 @@ class SQLiteStorage(BaseStorage):
                 CREATE INDEX IF NOT EXISTS idx_events_client
                 ON events(client_id)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_events_client_url
+                ON events(client_id, source_url)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_events_client_pub
+                ON events(client_id, published_date DESC)
+            """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_events_type
                 ON events(event_type)
@@ -207,6 +260,10 @@ class SQLiteStorage(BaseStorage):
                 CREATE INDEX IF NOT EXISTS idx_events_status
                 ON events(status)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_events_discovered
+                ON events(discovered_date DESC)
+            """)
 
             # Create search_cache table
             cursor.execute("""
@@ -256,6 +313,10 @@ class SQLiteStorage(BaseStorage):
                 CREATE INDEX IF NOT EXISTS idx_job_runs_status
                 ON job_runs(status)
             """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_job_runs_status_job
+                ON job_runs(status, job_name)
+            """)
 
             # Create notification_rules table
             cursor.execute("""
@@ -451,6 +512,22 @@ class SQLiteStorage(BaseStorage):
 
             return [self._row_to_client(row) for row in cursor.fetchall()]
 
+    def get_clients_by_ids(self, client_ids: Sequence[str]) -> List[ClientDTO]:
+        """Retrieve multiple clients by ID in a single query."""
+        client_ids = list(client_ids)
+        if not client_ids:
+            return []
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Bound as one JSON array so long id lists stay under SQLite's variable limit
+            cursor.execute(
+                "SELECT * FROM clients WHERE id IN (SELECT value FROM json_each(?)) ORDER BY name",
+                (json.dumps(client_ids),)
+            )
+
+            return [self._row_to_client(row) for row in cursor.fetchall()]
+
     def update_client(self, client_id: str, updates: Dict[str, Any]) -> Optional[ClientDTO]:
         """Update a client record."""
         with self.get_connection() as conn:
@@ -488,6 +565,24 @@ class SQLiteStorage(BaseStorage):
                 return self.get_client(client_id)
             return None
 
+    def bulk_update_client_last_checked(self, client_ids: Sequence[str], checked_at: datetime) -> int:
+        """Set last_checked on several clients in a single UPDATE."""
+        client_ids = list(client_ids)
+        if not client_ids:
+            return 0
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Bound as one JSON array so long id lists stay under SQLite's variable limit
+            cursor.execute(
+                "UPDATE clients SET last_checked = ?, updated_at = ?"
+                " WHERE id IN (SELECT value FROM json_each(?))",
+                (checked_at.isoformat(), datetime.utcnow().isoformat(), json.dumps(client_ids))
+            )
+
+            logger.info(f"Updated last_checked for {cursor.rowcount} clients")
+            return cursor.rowcount
+
     def delete_client(self, client_id: str) -> bool:
         """Delete a client record and all associated events."""
         with self.get_connection() as conn:
@@ -521,6 +616,82 @@ class SQLiteStorage(BaseStorage):
 
     # ==================== Event CRUD Operations ====================
 
+    # Old schema with INTEGER id - let database auto-generate
+    # Old schema also requires 'category' field (legacy from SQLAlchemy model)
+    _INSERT_EVENT_LEGACY_SQL = """
+        INSERT INTO events (
+            client_id, category, event_type, title, summary,
+            source_url, source_name, published_date, discovered_date,
+            relevance_score, sentiment, sentiment_score, status,
+            tags, user_notes, metadata,
+            description, url, source, event_date, discovered_at, is_read, is_starred
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    # New schema with TEXT id - use provided UUID
+    _INSERT_EVENT_SQL = """
+        INSERT INTO events (
+            id, client_id, event_type, title, summary,
+            source_url, source_name, published_date, discovered_date,
+            relevance_score, sentiment, sentiment_score, status,
+            tags, user_notes, metadata
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def _has_integer_event_ids(self, cursor) -> bool:
+        """Check if the events id column is INTEGER (old schema) or TEXT."""
+        cursor.execute("PRAGMA table_info(events)")
+        id_type = next((row[2] for row in cursor.fetchall() if row[1] == "id"), None)
+        return bool(id_type and "INT" in id_type.upper())
+
+    def _event_insert_params(self, event: EventDTO, legacy: bool) -> tuple:
+        """Parameters for _INSERT_EVENT_LEGACY_SQL (legacy=True) or _INSERT_EVENT_SQL."""
+        if legacy:
+            return (
+                event.client_id,
+                event.event_type,  # category = event_type for compatibility
+                event.event_type,
+                event.title,
+                event.summary,
+                event.source_url,
+                event.source_name,
+                event.published_date.isoformat(),
+                event.discovered_date.isoformat(),
+                event.relevance_score,
+                event.sentiment,
+                event.sentiment_score,
+                event.status,
+                json.dumps(event.tags),
+                event.user_notes,
+                json.dumps(event.metadata),
+                # Legacy fields for old schema compatibility
+                event.summary,  # description
+                event.source_url,  # url
+                event.source_name,  # source
+                event.published_date.isoformat(),  # event_date
+                event.discovered_date.isoformat(),  # discovered_at
+                0,  # is_read (False)
+                0,  # is_starred (False)
+            )
+        return (
+            event.id,
+            event.client_id,
+            event.event_type,
+            event.title,
+            event.summary,
+            event.source_url,
+            event.source_name,
+            event.published_date.isoformat(),
+            event.discovered_date.isoformat(),
+            event.relevance_score,
+            event.sentiment,
+            event.sentiment_score,
+            event.status,
+            json.dumps(event.tags),
+            event.user_notes,
+            json.dumps(event.metadata),
+        )
+
     def create_event(self, event: EventDTO) -> EventDTO:
         """Create a new event record. Compatible with both INTEGER and TEXT id columns."""
         is_valid, error = event.validate()
@@ -530,80 +701,47 @@ class SQLiteStorage(BaseStorage):
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if id column is INTEGER or TEXT
-            cursor.execute("PRAGMA table_info(events)")
-            id_type = next((row[2] for row in cursor.fetchall() if row[1] == "id"), None)
-
-            if id_type and "INT" in id_type.upper():
-                # Old schema with INTEGER id - let database auto-generate
-                # Old schema also requires 'category' field (legacy from SQLAlchemy model)
-                cursor.execute("""
-                    INSERT INTO events (
-                        client_id, category, event_type, title, summary,
-                        source_url, source_name, published_date, discovered_date,
-                        relevance_score, sentiment, sentiment_score, status,
-                        tags, user_notes, metadata,
-                        description, url, source, event_date, discovered_at, is_read, is_starred
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    event.client_id,
-                    event.event_type,  # category = event_type for compatibility
-                    event.event_type,
-                    event.title,
-                    event.summary,
-                    event.source_url,
-                    event.source_name,
-                    event.published_date.isoformat(),
-                    event.discovered_date.isoformat(),
-                    event.relevance_score,
-                    event.sentiment,
-                    event.sentiment_score,
-                    event.status,
-                    json.dumps(event.tags),
-                    event.user_notes,
-                    json.dumps(event.metadata),
-                    # Legacy fields for old schema compatibility
-                    event.summary,  # description
-                    event.source_url,  # url
-                    event.source_name,  # source
-                    event.published_date.isoformat(),  # event_date
-                    event.discovered_date.isoformat(),  # discovered_at
-                    0,  # is_read (False)
-                    0,  # is_starred (False)
-                ))
+            if self._has_integer_event_ids(cursor):
+                cursor.execute(self._INSERT_EVENT_LEGACY_SQL, self._event_insert_params(event, legacy=True))
                 # Update event with auto-generated id
                 event.id = str(cursor.lastrowid)
             else:
-                # New schema with TEXT id - use provided UUID
-                cursor.execute("""
-                    INSERT INTO events (
-                        id, client_id, event_type, title, summary,
-                        source_url, source_name, published_date, discovered_date,
-                        relevance_score, sentiment, sentiment_score, status,
-                        tags, user_notes, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    event.id,
-                    event.client_id,
-                    event.event_type,
-                    event.title,
-                    event.summary,
-                    event.source_url,
-                    event.source_name,
-                    event.published_date.isoformat(),
-                    event.discovered_date.isoformat(),
-                    event.relevance_score,
-                    event.sentiment,
-                    event.sentiment_score,
-                    event.status,
-                    json.dumps(event.tags),
-                    event.user_notes,
-                    json.dumps(event.metadata),
-                ))
+                cursor.execute(self._INSERT_EVENT_SQL, self._event_insert_params(event, legacy=False))
 
             logger.info(f"Created event: {event.title[:50]}... ({event.id})")
             return event
 
+    def create_events_bulk(self, events: Sequence[EventDTO]) -> List[EventDTO]:
+        """
+        Create several event records in one transaction.
+
+        All events are validated first; if any is invalid nothing is written.
+        """
+        for event in events:
+            is_valid, error = event.validate()
+            if not is_valid:
+                raise ValueError(f"Invalid event: {error}")
+
+        if not events:
+            return []
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+
+            if self._has_integer_event_ids(cursor):
+                # Each row needs its auto-generated id back, so no executemany here
+                for event in events:
+                    cursor.execute(self._INSERT_EVENT_LEGACY_SQL, self._event_insert_params(event, legacy=True))
+                    event.id = str(cursor.lastrowid)
+            else:
+                cursor.executemany(
+                    self._INSERT_EVENT_SQL,
+                    [self._event_insert_params(event, legacy=False) for event in events]
+                )
+
+            logger.info(f"Created {len(events)} events")
+            return list(events)
+
     def get_event(self, event_id: str) -> Optional[EventDTO]:
         """Retrieve an event by ID."""
         with self.get_connection() as conn:
@@ -615,6 +753,23 @@ class SQLiteStorage(BaseStorage):
                 return self._row_to_event(row)
             return None
 
+    def get_events_by_ids(self, event_ids: Sequence[str]) -> List[EventDTO]:
+        """Retrieve multiple events by ID in a single query, in the order given."""
+        event_ids = list(event_ids)
+        if not event_ids:
+            return []
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Bound as one JSON array so large selections stay under SQLite's variable limit
+            cursor.execute(
+                "SELECT * FROM events WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(event_ids),)
+            )
+
+            events = {row["id"]: self._row_to_event(row) for row in cursor.fetchall()}
+            return [events[event_id] for event_id in event_ids if event_id in events]
+
     def get_events_by_client(
         self,
         client_id: str,
@@ -633,6 +788,23 @@ class SQLiteStorage(BaseStorage):
 
             return [self._row_to_event(row) for row in cursor.fetchall()]
 
+    def filter_new_urls(self, client_id: str, urls: Sequence[str]) -> Set[str]:
+        """Return the URLs not already stored as an event for the client."""
+        urls = set(urls)
+        if not urls:
+            return set()
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Bound as one JSON array so large batches stay under SQLite's variable limit
+            cursor.execute(
+                "SELECT source_url FROM events"
+                " WHERE client_id = ? AND source_url IN (SELECT value FROM json_each(?))",
+                (client_id, json.dumps(list(urls)))
+            )
+
+            return urls - {row["source_url"] for row in cursor.fetchall()}
+
     def get_recent_events(
         self,
         days: int = 7,
@@ -664,6 +836,118 @@ class SQLiteStorage(BaseStorage):
             """)
             return [self._row_to_event(row) for row in cursor.fetchall()]
 
+    def _event_filter_clause(
+        self,
+        search: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        client_ids: Optional[Sequence[str]] = None,
+        event_types: Optional[Sequence[str]] = None,
+        sentiments: Optional[Sequence[str]] = None,
+        statuses: Optional[Sequence[str]] = None,
+        min_relevance: float = 0.0
+    ) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause and parameters shared by the event filter queries."""
+        clause = "events.relevance_score >= ?"
+        params: List[Any] = [min_relevance]
+
+        if search:
+            clause += " AND (instr(py_lower(events.title), ?) OR instr(py_lower(events.summary), ?))"
+            params.extend([search.lower()] * 2)
+
+        if from_date:
+            clause += " AND events.discovered_date >= ?"
+            params.append(from_date.isoformat())
+
+        for column, values in (
+            ("client_id", client_ids),
+            ("event_type", event_types),
+            ("sentiment", sentiments),
+            ("status", statuses),
+        ):
+            # Passed as one JSON array so long lists stay under SQLite's variable limit
+            if values is not None:
+                clause += f" AND events.{column} IN (SELECT value FROM json_each(?))"
+                params.append(json.dumps(list(values)))
+
+        return clause, params
+
+    def query_events(
+        self,
+        search: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        client_ids: Optional[Sequence[str]] = None,
+        event_types: Optional[Sequence[str]] = None,
+        sentiments: Optional[Sequence[str]] = None,
+        statuses: Optional[Sequence[str]] = None,
+        min_relevance: float = 0.0,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[EventDTO]:
+        """
+        Retrieve events matching all given filters, newest first.
+
+        A filter left as None is not applied; an empty sequence matches
+        nothing. `search` is a case-insensitive substring match on title
+        or summary, folding case with Python's str.lower().
+        """
+        clause, params = self._event_filter_clause(
+            search, from_date, client_ids, event_types, sentiments, statuses, min_relevance
+        )
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+
+            query = f"SELECT * FROM events WHERE {clause} ORDER BY published_date DESC"
+            if limit is not None:
+                query += " LIMIT ? OFFSET ?"
+                params.extend([limit, offset])
+
+            cursor.execute(query, params)
+            return [self._row_to_event(row) for row in cursor.fetchall()]
+
+    def top_clients_by_events(self, limit: int = 10, **filters) -> List[Tuple[str, int]]:
+        """
+        Count events per client name, largest first.
+
+        Accepts the same filters as `query_events`; events whose client
+        no longer exists are not counted.
+        """
+        clause, params = self._event_filter_clause(**filters)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT clients.name, COUNT(*) as count
+                FROM events
+                JOIN clients ON clients.id = events.client_id
+                WHERE {clause}
+                GROUP BY clients.name
+                ORDER BY count DESC, clients.name
+                LIMIT ?
+            """, params + [limit])
+            return [(row[0], row[1]) for row in cursor.fetchall()]
+
+    def top_sources_by_events(self, limit: int = 10, **filters) -> List[Tuple[str, int]]:
+        """
+        Count events per source name, largest first.
+
+        Accepts the same filters as `query_events`; events without a
+        source are not counted.
+        """
+        clause, params = self._event_filter_clause(**filters)
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT source_name, COUNT(*) as count
+                FROM events
+                WHERE {clause} AND source_name IS NOT NULL AND source_name != ''
+                GROUP BY source_name
+                ORDER BY count DESC, source_name
+                LIMIT ?
+            """, params + [limit])
+            return [(row[0], row[1]) for row in cursor.fetchall()]
+
     def update_event(self, event_id: str, updates: Dict[str, Any]) -> Optional[EventDTO]:
         """Update an event record."""
         with self.get_connection() as conn:
@@ -706,6 +990,30 @@ class SQLiteStorage(BaseStorage):
                 return True
             return False
 
+    def bulk_update_event_status(self, event_ids: Sequence[str], status: str) -> int:
+        """Set the status of several events in one transaction."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "UPDATE events SET status = ? WHERE id = ?",
+                [(status, event_id) for event_id in event_ids]
+            )
+
+            logger.info(f"Updated status to '{status}' for {cursor.rowcount} events")
+            return cursor.rowcount
+
+    def bulk_delete_events(self, event_ids: Sequence[str]) -> int:
+        """Delete several events in one transaction."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "DELETE FROM events WHERE id = ?",
+                [(event_id,) for event_id in event_ids]
+            )
+
+            logger.info(f"Deleted {cursor.rowcount} events")
+            return cursor.rowcount
+
     def search_events(
         self,
         query: str,
@@ -1026,26 +1334,43 @@ class SQLiteStorage(BaseStorage):
                 )
             return None
 
-    def get_recent_job_runs(self, job_name: Optional[str] = None, limit: int = 50):
-        """Get recent job runs, optionally filtered by job name."""
+    def get_recent_job_runs(
+        self,
+        job_name: Optional[str] = None,
+        limit: int = 50,
+        job_names: Optional[Sequence[str]] = None,
+        statuses: Optional[Sequence[str]] = None
+    ):
+        """
+        Get recent job runs, optionally filtered by job name(s) and status.
+
+        Filters are applied in SQL before LIMIT, so the result holds up to
+        `limit` matching runs rather than a filtered slice of the latest runs.
+        """
         from src.models.job_run import JobRun
 
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
+            query = "SELECT * FROM job_runs WHERE 1=1"
+            params = []
+
             if job_name:
-                cursor.execute("""
-                    SELECT * FROM job_runs
-                    WHERE job_name = ?
-                    ORDER BY start_time DESC
-                    LIMIT ?
-                """, (job_name, limit))
-            else:
-                cursor.execute("""
-                    SELECT * FROM job_runs
-                    ORDER BY start_time DESC
-                    LIMIT ?
-                """, (limit,))
+                query += " AND job_name = ?"
+                params.append(job_name)
+
+            if job_names is not None:
+                query += f" AND job_name IN ({','.join('?' * len(job_names))})"
+                params.extend(job_names)
+
+            if statuses is not None:
+                query += f" AND status IN ({','.join('?' * len(statuses))})"
+                params.extend(statuses)
+
+            query += " ORDER BY start_time DESC LIMIT ?"
+            params.append(limit)
+
+            cursor.execute(query, params)
 
             runs = []
             for row in cursor.fetchall():
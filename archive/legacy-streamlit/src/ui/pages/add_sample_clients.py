@@ -111,14 +111,15 @@ def add_sample_clients(storage: SQLiteStorage, count: int = 10):
 
     progress_bar.progress(1.0)
     status_text.text("✅ Sample clients created successfully!")
+    st.cache_data.clear()
 
     return created_ids
 
 
 def render_add_sample_clients_page():
     """Render the add sample clients page."""
-    st.markdown('<h1 class="main-header">Add Sample Clients</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Quickly populate your database with realistic sample data</p>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-header">Add Sample Clients</h1>'
+                '<p class="subtitle">Quickly populate your database with realistic sample data</p>', unsafe_allow_html=True)
 
     st.info("""
     👋 **Welcome!** This tool will help you get started by adding sample clients to your database.
@@ -220,6 +221,7 @@ def render_add_sample_clients_page():
 
                 progress_bar.progress(1.0)
                 status_text.text(f"✅ Removed {removed_count} sample clients")
+                st.cache_data.clear()
 
                 st.session_state.removing_samples = False
                 st.rerun()
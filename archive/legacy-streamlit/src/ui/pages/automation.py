@@ -1,26 +1,43 @@
 """Automation and scheduler control panel."""
 
 import streamlit as st
-from datetime import datetime, timedelta
-import pandas as pd
+from datetime import datetime, timedelta, time as dt_time
 from typing import List
 
 from src.storage import SQLiteStorage
-from src.scheduler.jobs import run_job, JOBS
 from src.models.job_run import JobRun
 
+# Default schedule times
+_DEFAULT_DAILY = dt_time(8, 0)
+_DEFAULT_REPORT = dt_time(9, 0)
+_DEFAULT_CLEANUP = dt_time(2, 0)
+_DEFAULT_QUIET_START = dt_time(22, 0)
+_DEFAULT_QUIET_END = dt_time(6, 0)
+
+# Static widget options
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_JOB_STATUS_OPTIONS = ("All", "completed", "failed", "running", "cancelled")
+_SCAN_FREQUENCIES = ("Once daily", "Twice daily", "Every 6 hours", "Every 4 hours")
+
+
+# Initialize storage
+@st.cache_resource
+def get_storage():
+    """Get or create storage instance."""
+    storage = SQLiteStorage()
+    storage.connect()
+    return storage
 
-def render_status_indicator(status: str):
-    """Render status indicator with icon and color."""
-    status_config = {
-        "running": {"icon": "🟢", "label": "Running", "color": "#10b981"},
-        "idle": {"icon": "🟡", "label": "Idle", "color": "#f59e0b"},
-        "stopped": {"icon": "🔴", "label": "Stopped", "color": "#ef4444"},
-    }
 
-    config = status_config.get(status, status_config["idle"])
+# Status indicator config and pre-rendered HTML (built once at import)
+_STATUS_CONFIG = {
+    "running": {"icon": "🟢", "label": "Running", "color": "#10b981"},
+    "idle": {"icon": "🟡", "label": "Idle", "color": "#f59e0b"},
+    "stopped": {"icon": "🔴", "label": "Stopped", "color": "#ef4444"},
+}
 
-    st.markdown(f"""
+_STATUS_HTML = {
+    status: f"""
     <div style="text-align: center; padding: 1rem; background-color: {config['color']}20;
                 border-radius: 8px; border: 2px solid {config['color']};">
         <div style="font-size: 2rem;">{config['icon']}</div>
@@ -28,7 +45,14 @@ def render_status_indicator(status: str):
             {config['label']}
         </div>
     </div>
-    """, unsafe_allow_html=True)
+    """
+    for status, config in _STATUS_CONFIG.items()
+}
+
+
+def render_status_indicator(status: str):
+    """Render status indicator with icon and color."""
+    st.markdown(_STATUS_HTML.get(status, _STATUS_HTML["idle"]), unsafe_allow_html=True)
 
 
 def render_job_run_row(job_run: JobRun, storage: SQLiteStorage):
@@ -131,10 +155,17 @@ def render_manual_scan_interface(storage: SQLiteStorage):
     """Render manual scan controls."""
     st.subheader("🚀 Manual Scan")
 
-    # Get all clients
+    # Get all clients and partition them in a single pass
     all_clients = storage.get_all_clients()
-    active_clients = [c for c in all_clients if c.is_active]
-    high_priority = [c for c in active_clients if c.priority == "high"]
+    active_clients, active_names = [], []
+    high_priority, high_names = [], []
+    for c in all_clients:
+        if c.is_active:
+            active_clients.append(c)
+            active_names.append(c.name)
+            if c.priority == "high":
+                high_priority.append(c)
+                high_names.append(c.name)
 
     col1, col2 = st.columns(2)
 
@@ -152,11 +183,15 @@ def render_manual_scan_interface(storage: SQLiteStorage):
 
     st.divider()
 
-    # Targeted scan
+    # Targeted scan (reuse the cached options tuple while client names are unchanged)
+    client_names = tuple(active_names)
+    if st.session_state.get("_client_names_cache") != client_names:
+        st.session_state._client_names_cache = client_names
+
     st.markdown("**🎯 Targeted Scan**")
     selected_clients = st.multiselect(
         "Select specific clients",
-        options=[c.name for c in active_clients],
+        options=st.session_state._client_names_cache,
         key="targeted_scan_clients"
     )
 
@@ -189,7 +224,7 @@ def render_manual_scan_interface(storage: SQLiteStorage):
                     job_name_suffix = "full_scan"
                 elif scan_type == "quick":
                     # Scan only high priority clients
-                    client_filter = [c.name for c in high_priority]
+                    client_filter = high_names
                     job_name_suffix = "quick_scan"
                 elif scan_type == "targeted":
                     # Scan only selected clients
@@ -254,24 +289,25 @@ def render_manual_scan_interface(storage: SQLiteStorage):
                     st.rerun()
 
 
-def render_automation_page():
-    """Main automation control panel."""
-    st.markdown('<h1 class="main-header">Automation & Monitoring</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Configure and monitor automated scanning</p>', unsafe_allow_html=True)
-
-    # Initialize storage
-    storage = SQLiteStorage()
-    storage.connect()
+@st.fragment(run_every=30)
+def _render_next_scan_metric(status_data: dict):
+    """Render the "Next Scan" countdown, refreshing on its own every 30s."""
+    if status_data.get("next_run"):
+        try:
+            next_run = datetime.fromisoformat(status_data["next_run"])
+            time_until = next_run - datetime.now()
+            hours = int(time_until.total_seconds() // 3600)
+            minutes = int((time_until.total_seconds() % 3600) // 60)
+            st.metric("Next Scan", f"{hours}h {minutes}m")
+        except Exception:
+            st.metric("Next Scan", "Not scheduled")
+    else:
+        st.metric("Next Scan", "Not scheduled")
 
-    # Check if viewing job detail
-    if st.session_state.get("viewing_job_run"):
-        job_run = storage.get_job_run(st.session_state.viewing_job_run)
-        if job_run:
-            render_job_detail_modal(job_run)
-            return
-        else:
-            del st.session_state.viewing_job_run
 
+@st.fragment
+def _render_scheduler_status_frag(storage: SQLiteStorage):
+    """Render scheduler status and monitoring controls."""
     # Real-time Scheduler Status Widget (moved from sidebar)
     from src.scheduler.control import is_scheduler_running, start_scheduler, stop_scheduler
     from src.scheduler.runner import get_scheduler_status
@@ -293,17 +329,7 @@ def render_automation_page():
 
     with col2:
         # Next run countdown
-        if status_data.get("next_run"):
-            try:
-                next_run = datetime.fromisoformat(status_data["next_run"])
-                time_until = next_run - datetime.now()
-                hours = int(time_until.total_seconds() // 3600)
-                minutes = int((time_until.total_seconds() % 3600) // 60)
-                st.metric("Next Scan", f"{hours}h {minutes}m")
-            except Exception:
-                st.metric("Next Scan", "Not scheduled")
-        else:
-            st.metric("Next Scan", "Not scheduled")
+        _render_next_scan_metric(status_data)
 
     with col3:
         # Start/Stop button
@@ -325,14 +351,13 @@ def render_automation_page():
     # Recent job status
     if status_data.get("last_runs"):
         with st.expander("📋 Recent Jobs Summary"):
-            cols = st.columns(3)
-            for idx, (job_name, job_info) in enumerate(list(status_data["last_runs"].items())[:3]):
-                with cols[idx]:
-                    status_icon = "✅" if job_info["status"] == "completed" else "❌"
-                    st.markdown(f"{status_icon} **{job_name}**")
-                    summary = job_info.get("summary") or "No summary"
-                    summary_display = summary[:40] if summary else "No summary"
-                    st.caption(summary_display + "...")
+            # Read-only content: one markdown table instead of a column grid
+            rows = ["| Job | Status | Summary |", "|---|---|---|"]
+            for job_name, job_info in list(status_data["last_runs"].items())[:3]:
+                status_icon = "✅" if job_info["status"] == "completed" else "❌"
+                summary = (job_info.get("summary") or "No summary")[:40].replace("|", "\\|")
+                rows.append(f"| **{job_name}** | {status_icon} | {summary}... |")
+            st.markdown("\n".join(rows))
 
     st.divider()
 
@@ -362,17 +387,22 @@ def render_automation_page():
         # Next scheduled run
         st.markdown("**Next Scheduled Run**")
         # Calculate next run (example: tomorrow at 8 AM)
-        next_run = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
-        if next_run < datetime.now():
+        now = datetime.now()
+        next_run = now.replace(hour=8, minute=0, second=0, microsecond=0)
+        if next_run < now:
             next_run += timedelta(days=1)
 
-        time_until = next_run - datetime.now()
+        time_until = next_run - now
         hours = int(time_until.total_seconds() // 3600)
         minutes = int((time_until.total_seconds() % 3600) // 60)
 
         st.metric("Daily Scan", f"in {hours}h {minutes}m")
 
-    st.divider()
+
+@st.fragment
+def _render_schedule_config_frag(storage: SQLiteStorage):
+    """Render job schedule configuration and run-now buttons."""
+    from src.scheduler.jobs import run_job
 
     # Job Schedule Configuration
     st.subheader("⏰ Schedule Configuration")
@@ -383,7 +413,7 @@ def render_automation_page():
         st.markdown("**Daily Scan**")
         daily_time = st.time_input(
             "Time",
-            value=datetime.strptime("08:00", "%H:%M").time(),
+            value=_DEFAULT_DAILY,
             key="daily_scan_time",
             label_visibility="collapsed"
         )
@@ -400,14 +430,14 @@ def render_automation_page():
         st.markdown("**Weekly Report**")
         report_day = st.selectbox(
             "Day",
-            ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+            _WEEKDAYS,
             index=0,
             key="report_day",
             label_visibility="collapsed"
         )
         report_time = st.time_input(
             "Time",
-            value=datetime.strptime("09:00", "%H:%M").time(),
+            value=_DEFAULT_REPORT,
             key="report_time",
             label_visibility="collapsed"
         )
@@ -426,7 +456,7 @@ def render_automation_page():
         st.markdown("**Cache Cleanup**")
         cleanup_time = st.time_input(
             "Time",
-            value=datetime.strptime("02:00", "%H:%M").time(),
+            value=_DEFAULT_CLEANUP,
             key="cleanup_time",
             label_visibility="collapsed"
         )
@@ -449,12 +479,17 @@ def render_automation_page():
         }
         st.success("✅ Schedule saved!")
 
-    st.divider()
 
-    # Manual Scan Interface
+@st.fragment
+def _render_manual_scan_frag(storage: SQLiteStorage):
+    """Render the manual scan interface."""
     render_manual_scan_interface(storage)
 
-    st.divider()
+
+@st.fragment
+def _render_job_history_frag(storage: SQLiteStorage):
+    """Render filtered job run history."""
+    from src.scheduler.jobs import JOBS
 
     # Job History
     st.subheader("📜 Job History")
@@ -473,7 +508,7 @@ def render_automation_page():
     with col2:
         filter_status = st.multiselect(
             "Status",
-            options=["All", "completed", "failed", "running", "cancelled"],
+            options=_JOB_STATUS_OPTIONS,
             default=["All"],
             key="filter_status"
         )
@@ -481,15 +516,12 @@ def render_automation_page():
     with col3:
         limit = st.number_input("Show last", min_value=10, max_value=100, value=20, step=10)
 
-    # Get job runs
-    all_runs = storage.get_recent_job_runs(limit=limit)
-
-    # Apply filters
-    if "All" not in filter_job_type:
-        all_runs = [r for r in all_runs if r.job_name in filter_job_type]
-
-    if "All" not in filter_status:
-        all_runs = [r for r in all_runs if r.status in filter_status]
+    # Get job runs (filters applied in SQL; "All" means no filter)
+    all_runs = storage.get_recent_job_runs(
+        limit=limit,
+        job_names=None if "All" in filter_job_type else filter_job_type,
+        statuses=None if "All" in filter_status else filter_status,
+    )
 
     # Display job runs
     if all_runs:
@@ -500,8 +532,10 @@ def render_automation_page():
     else:
         st.info("📭 No job runs found. Run a job to see history here.")
 
-    st.divider()
 
+@st.fragment
+def _render_stats_frag(storage: SQLiteStorage):
+    """Render automation settings and job statistics."""
     # Settings
     st.subheader("⚙️ Settings")
 
@@ -517,7 +551,7 @@ def render_automation_page():
         st.markdown("**Scan Frequency**")
         frequency = st.select_slider(
             "Frequency",
-            options=["Once daily", "Twice daily", "Every 6 hours", "Every 4 hours"],
+            options=_SCAN_FREQUENCIES,
             value="Once daily",
             key="scan_frequency",
             label_visibility="collapsed"
@@ -526,9 +560,9 @@ def render_automation_page():
     st.markdown("**Quiet Hours**")
     col1, col2 = st.columns(2)
     with col1:
-        quiet_start = st.time_input("Start", value=datetime.strptime("22:00", "%H:%M").time())
+        quiet_start = st.time_input("Start", value=_DEFAULT_QUIET_START)
     with col2:
-        quiet_end = st.time_input("End", value=datetime.strptime("06:00", "%H:%M").time())
+        quiet_end = st.time_input("End", value=_DEFAULT_QUIET_END)
 
     st.caption("Scans will not run during quiet hours")
 
@@ -582,3 +616,31 @@ def render_automation_page():
         success_rate = (completed / stats["total"]) * 100
         st.progress(success_rate / 100)
         st.caption(f"Success Rate: {success_rate:.1f}%")
+
+
+def render_automation_page():
+    """Main automation control panel."""
+    st.markdown('<h1 class="main-header">Automation & Monitoring</h1>'
+                '<p class="subtitle">Configure and monitor automated scanning</p>', unsafe_allow_html=True)
+
+    storage = get_storage()
+
+    # Check if viewing job detail
+    if st.session_state.get("viewing_job_run"):
+        job_run = storage.get_job_run(st.session_state.viewing_job_run)
+        if job_run:
+            render_job_detail_modal(job_run)
+            return
+        else:
+            del st.session_state.viewing_job_run
+
+    # Each section is a fragment, so widgets inside one only rerun that section
+    _render_scheduler_status_frag(storage)
+    st.divider()
+    _render_schedule_config_frag(storage)
+    st.divider()
+    _render_manual_scan_frag(storage)
+    st.divider()
+    _render_job_history_frag(storage)
+    st.divider()
+    _render_stats_frag(storage)
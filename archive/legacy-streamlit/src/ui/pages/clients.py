@@ -141,6 +141,7 @@ def render_client_form(
                         metadata={}
                     )
                     storage.create_client(new_client)
+                    st.cache_data.clear()
                     st.success(f"✅ Client '{name}' added successfully!")
 
                     # Clear form state
@@ -160,6 +161,7 @@ def render_client_form(
                         'keywords': keywords_list,
                         'is_active': is_active
                     })
+                    st.cache_data.clear()
                     st.success(f"✅ Client '{name}' updated successfully!")
 
                     # Clear editing state
@@ -286,7 +288,7 @@ def render_client_detail_view(client: ClientDTO, storage: SQLiteStorage):
         events = storage.get_events_by_client(client.id)
         st.subheader("📊 Statistics")
         st.metric("Total Events", len(events))
-        high_priority = len([e for e in events if hasattr(e, 'relevance_score') and e.relevance_score >= 0.7])
+        high_priority = sum(1 for e in events if hasattr(e, 'relevance_score') and e.relevance_score >= 0.7)
         st.metric("High Priority", high_priority)
 
     # Keywords section
@@ -386,6 +388,7 @@ def render_clients_page():
                 if st.button("✅ Yes, Delete", type="primary", use_container_width=True):
                     try:
                         storage.delete_client(client.id)
+                        st.cache_data.clear()
                         st.success(f"✅ Client '{client.name}' and {event_count} event(s) deleted")
                         del st.session_state.deleting_client_id
                         st.rerun()
@@ -398,8 +401,8 @@ def render_clients_page():
             st.divider()
 
     # Page header
-    st.markdown('<h1 class="main-header">Client Management</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Manage your client portfolio and monitoring settings</p>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-header">Client Management</h1>'
+                '<p class="subtitle">Manage your client portfolio and monitoring settings</p>', unsafe_allow_html=True)
 
     # Top action bar
     col1, col2, col3 = st.columns([3, 1, 1])
@@ -1,10 +1,59 @@
 """Collector Test Page - Test news/event collection without paid APIs."""
 
+import json
+import time
 import streamlit as st
 from datetime import datetime, timedelta
-import pandas as pd
 from src.collectors import get_collector, list_available_collectors
 
+# Raw data larger than this (serialized chars) is shown as a truncated preview
+_RAW_DATA_PREVIEW_CHARS = 2048
+
+# Static integration guide rendered at the bottom of the page
+_INTEGRATION_GUIDE_MD = """
+    ### How to use the collector in your code:
+
+    ```python
+    from src.collectors import get_collector
+
+    # Get collector (automatically uses mock by default)
+    collector = get_collector()
+
+    # Search for events
+    results = collector.search(
+        query="TechCorp",
+        from_date=datetime.utcnow() - timedelta(days=30),
+        max_results=10
+    )
+
+    # Get company-specific news
+    results = collector.get_company_news(
+        company_name="Acme Corp",
+        max_results=20
+    )
+
+    # Check rate limits
+    status = collector.get_rate_limit_status()
+    print(f"Remaining: {status['remaining']}/{status['limit']}")
+    ```
+
+    ### Keywords that influence results:
+    - **funding, investment, raised, series** → Funding announcements
+    - **acquisition, merger, buyout** → Acquisition news
+    - **CEO, CTO, leadership, executive** → Leadership changes
+    - **product, launch, release** → Product announcements
+    - **partnership, collaboration** → Partnership news
+    - **earnings, revenue, financial** → Financial results
+    - **award, recognition** → Awards and recognition
+
+    ### Switching to real APIs:
+    Set the `APP_MODE` or `COLLECTOR_TYPE` environment variable:
+    ```bash
+    export APP_MODE=newsapi  # Use NewsAPI (when implemented)
+    export APP_MODE=mock     # Use mock data (default)
+    ```
+    """
+
 
 def render_collector_test_page():
     """Render the collector testing page."""
@@ -107,6 +156,8 @@ def render_collector_test_page():
             st.warning("Please enter a search query")
             return
 
+        import pandas as pd
+
         with st.spinner(f"Searching for: **{search_query}** (this may take 0.5-1 second to simulate API latency)..."):
             try:
                 # Calculate date range
@@ -114,15 +165,14 @@ def render_collector_test_page():
                 from_date = to_date - timedelta(days=lookback_days)
 
                 # Perform search
-                start_time = datetime.utcnow()
+                start_time = time.perf_counter()
                 results = collector.search(
                     query=search_query,
                     from_date=from_date,
                     to_date=to_date,
                     max_results=max_results
                 )
-                end_time = datetime.utcnow()
-                duration = (end_time - start_time).total_seconds()
+                duration = time.perf_counter() - start_time
 
                 st.success(f"✅ Found **{len(results)}** results in **{duration:.2f}** seconds")
 
@@ -135,8 +185,15 @@ def render_collector_test_page():
                     st.divider()
                     st.subheader(f"📰 Search Results ({len(results)})")
 
-                    # Display results
+                    # Display results, collecting summary columns in the same pass
+                    titles, sources, published, categories = [], [], [], []
+
                     for i, result in enumerate(results, 1):
+                        titles.append(result.title)
+                        sources.append(result.source)
+                        published.append(result.published_at)
+                        categories.append(result.raw_data.get("category", "N/A") if result.raw_data else "N/A")
+
                         with st.container():
                             st.markdown(f"### {i}. {result.title}")
 
@@ -161,23 +218,28 @@ def render_collector_test_page():
                             # Show raw data in expander
                             if result.raw_data:
                                 with st.expander("🔍 View Raw Data"):
-                                    st.json(result.raw_data)
+                                    raw_text = json.dumps(result.raw_data, indent=2, default=str)
+                                    if len(raw_text) > _RAW_DATA_PREVIEW_CHARS:
+                                        st.caption(f"Raw data truncated ({len(raw_text):,} characters)")
+                                        st.code(raw_text[:_RAW_DATA_PREVIEW_CHARS] + "\n...", language="json")
+                                    else:
+                                        st.json(result.raw_data)
 
                             st.divider()
 
                     # Results summary table
                     st.subheader("📊 Results Summary")
 
-                    summary_data = []
-                    for result in results:
-                        summary_data.append({
-                            "Title": result.title[:60] + "..." if len(result.title) > 60 else result.title,
-                            "Source": result.source,
-                            "Published": result.published_at.strftime("%Y-%m-%d"),
-                            "Category": result.raw_data.get("category", "N/A") if result.raw_data else "N/A",
-                        })
-
-                    df = pd.DataFrame(summary_data)
+                    df = pd.DataFrame({
+                        "Title": titles,
+                        "Source": sources,
+                        "Published": pd.to_datetime(published).strftime("%Y-%m-%d"),
+                        "Category": categories,
+                    })
+                    df["Title"] = df["Title"].where(
+                        df["Title"].str.len() <= 60,
+                        df["Title"].str.slice(0, 60) + "..."
+                    )
                     st.dataframe(df, use_container_width=True, hide_index=True)
 
                 else:
@@ -193,46 +255,4 @@ def render_collector_test_page():
     st.divider()
     st.subheader("🔗 Integration Guide")
 
-    st.markdown("""
-    ### How to use the collector in your code:
-
-    ```python
-    from src.collectors import get_collector
-
-    # Get collector (automatically uses mock by default)
-    collector = get_collector()
-
-    # Search for events
-    results = collector.search(
-        query="TechCorp",
-        from_date=datetime.utcnow() - timedelta(days=30),
-        max_results=10
-    )
-
-    # Get company-specific news
-    results = collector.get_company_news(
-        company_name="Acme Corp",
-        max_results=20
-    )
-
-    # Check rate limits
-    status = collector.get_rate_limit_status()
-    print(f"Remaining: {status['remaining']}/{status['limit']}")
-    ```
-
-    ### Keywords that influence results:
-    - **funding, investment, raised, series** → Funding announcements
-    - **acquisition, merger, buyout** → Acquisition news
-    - **CEO, CTO, leadership, executive** → Leadership changes
-    - **product, launch, release** → Product announcements
-    - **partnership, collaboration** → Partnership news
-    - **earnings, revenue, financial** → Financial results
-    - **award, recognition** → Awards and recognition
-
-    ### Switching to real APIs:
-    Set the `APP_MODE` or `COLLECTOR_TYPE` environment variable:
-    ```bash
-    export APP_MODE=newsapi  # Use NewsAPI (when implemented)
-    export APP_MODE=mock     # Use mock data (default)
-    ```
-    """)
+    st.markdown(_INTEGRATION_GUIDE_MD)
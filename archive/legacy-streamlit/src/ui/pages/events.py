@@ -2,10 +2,16 @@
 
 import streamlit as st
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import pandas as pd
+import numpy as np
 from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 import re
+import time
 
 from src.storage import SQLiteStorage
 from src.models.event_dto import EventDTO
@@ -31,33 +37,187 @@ SENTIMENT_CONFIG = {
     "negative": {"emoji": "😟", "color": "#ef4444"},
 }
 
+EVENT_TYPE_LABELS = {k: f"{c['icon']} {c['label']}" for k, c in EVENT_TYPE_CONFIG.items()}
+
+# Sidebar filter labels -> stored keys
+EVENT_LABEL_TO_KEY = {label: k for k, label in EVENT_TYPE_LABELS.items()}
+SENTIMENT_LABEL_TO_KEY = {f"{c['emoji']} {s.capitalize()}": s for s, c in SENTIMENT_CONFIG.items()}
+STATUS_MAP = {"New": "new", "Reviewed": "reviewed", "Actioned": "actioned", "Archived": "archived"}
+
+STATUS_ICONS = {"new": "🆕", "reviewed": "👁️", "actioned": "✅", "archived": "📦"}
+
+# Relevance histogram bucket edges (left-closed) and labels for the analytics view
+RELEVANCE_EDGES = [0.3, 0.5, 0.7]
+RELEVANCE_RANGES = ["0.0-0.3", "0.3-0.5", "0.5-0.7", "0.7-1.0"]
+
+# (minimum score, color, label), highest band first
+RELEVANCE_BANDS = [(0.7, "#10b981", "High"), (0.4, "#f59e0b", "Medium"), (0.0, "#6b7280", "Low")]
+
+
+# Initialize storage
+@st.cache_resource
+def get_storage():
+    """Get or create storage instance."""
+    storage = SQLiteStorage()
+    storage.connect()
+    return storage
+
+
+@st.cache_data(ttl=60)
+def _clients_by_name(_storage: SQLiteStorage) -> Dict[str, str]:
+    """Map client name to id (cached; cleared on client create/update/delete)."""
+    return {c.name: c.id for c in _storage.get_all_clients()}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_all_events(_storage: SQLiteStorage, db_path: str, db_version: Tuple[int, int]) -> List[EventDTO]:
+    """All events, cached until the database changes (see _db_version)."""
+    return _storage.get_all_events()
+
+
+def _db_version(storage: SQLiteStorage) -> Tuple[int, int]:
+    """Changes whenever the database does.
+
+    PRAGMA data_version moves on commits from other connections and
+    total_changes on writes through this one; unlike the file's mtime,
+    both see commits that are still sitting in the WAL.
+    """
+    with storage.get_connection() as conn:
+        return conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes
+
+
+def _all_events(storage: SQLiteStorage) -> List[EventDTO]:
+    """Cached storage.get_all_events()."""
+    db_version = _db_version(storage)
+    events = _load_all_events(storage, storage.db_path, db_version)
+    # Each call returns a fresh copy, so key it on the database's version
+    # rather than rehashing every event
+    _remember_events_version(events, hash((storage.db_path, db_version)))
+    return events
+
+
+@st.cache_data(ttl=30)
+def _client_name_map(_storage: SQLiteStorage, client_ids: tuple) -> Dict[str, str]:
+    """Map client id to name for the given ids using one batched query."""
+    return {c.id: c.name for c in _storage.get_clients_by_ids(client_ids)}
+
+
+def _event_client_names(storage: SQLiteStorage, events: List[EventDTO]) -> Dict[str, str]:
+    """Client id -> name for every client referenced by events."""
+    return _client_name_map(storage, tuple(sorted(set(map(attrgetter("client_id"), events)))))
+
+
+# Number of event lists whose version _events_version remembers per session
+_EVENTS_VERSION_MEMO_SIZE = 4
+
+
+def _remember_events_version(events: List[EventDTO], version: int) -> None:
+    """Record version as the cache key of this events list object."""
+    memo = st.session_state.setdefault("events_version_memo", {})
+    memo[id(events)] = (events, version)
+    while len(memo) > _EVENTS_VERSION_MEMO_SIZE:
+        del memo[next(iter(memo))]
+
+
+def _events_version(events: List[EventDTO]) -> int:
+    """Cheap cache key for an events list (ids plus UI-editable status).
+
+    Loaded lists are never mutated (writes reload them instead), so the
+    key is remembered for the last few list objects seen (by identity)
+    and not recomputed while they are still in use. The all-events list
+    is registered by _all_events with a key from the database's version.
+    """
+    entry = st.session_state.get("events_version_memo", {}).get(id(events))
+    if entry is not None and entry[0] is events:
+        return entry[1]
+    version = hash(tuple(map(attrgetter("id", "status"), events)))
+    _remember_events_version(events, version)
+    return version
+
+
+@st.cache_data
+def _events_df(events_version: int, _events: List[EventDTO]) -> pd.DataFrame:
+    """Columnar projection of event fields, one row per event (row i is events[i]).
+
+    Only columns the views read are kept and repeated strings are
+    categoricals, to keep the cached frame small.
+    """
+    df = pd.DataFrame({
+        "title": list(map(attrgetter("title"), _events)),
+        "source_name": [e.source_name or "" for e in _events],
+        "published_date": pd.to_datetime(list(map(attrgetter("published_date"), _events))),
+        "client_id": list(map(attrgetter("client_id"), _events)),
+        "event_type": list(map(attrgetter("event_type"), _events)),
+        "sentiment": list(map(attrgetter("sentiment"), _events)),
+        "status": list(map(attrgetter("status"), _events)),
+        "relevance_score": list(map(attrgetter("relevance_score"), _events)),
+    })
+    for col in ("client_id", "source_name", "event_type", "sentiment", "status"):
+        df[col] = df[col].astype("category")
+    return df
+
+
+@st.cache_data
+def _sorted_indices(events_version: int, sort_by: str, _events: List[EventDTO],
+                    _client_names: Dict[str, str]) -> np.ndarray:
+    """Display order of events for a sort option (cached so paging doesn't re-sort)."""
+    if sort_by == "Relevance (High to Low)":
+        keys = -np.fromiter(map(attrgetter("relevance_score"), _events), dtype=float, count=len(_events))
+    elif sort_by.startswith("Date"):
+        keys = np.array(list(map(attrgetter("published_date"), _events)), dtype="datetime64[us]").astype(np.int64)
+        if sort_by == "Date (Newest First)":
+            keys = -keys
+    else:  # Client Name
+        keys = np.array([_client_names.get(e.client_id, "") for e in _events])
+    return np.argsort(keys, kind="stable")
+
+
+@lru_cache(maxsize=32)
+def _highlight_pattern(search_term: str) -> "re.Pattern[str]":
+    """Compiled case-insensitive pattern for a search term."""
+    return re.compile(f"({re.escape(search_term)})", re.IGNORECASE)
+
+
+def relevance_band(score: float) -> Tuple[str, str]:
+    """Color and label for a relevance score."""
+    return next(((color, label) for threshold, color, label in RELEVANCE_BANDS if score >= threshold),
+                RELEVANCE_BANDS[-1][1:])
+
 
 def highlight_search_text(text: str, search_term: str) -> str:
     """Highlight search term in text."""
     if not search_term or not text:
         return text
 
-    pattern = re.compile(f"({re.escape(search_term)})", re.IGNORECASE)
-    return pattern.sub(r"**\1**", text)
+    return _highlight_pattern(search_term).sub(r"**\1**", text)
+
+
+@st.cache_data
+def _events_index(events_version: int, _events: List[EventDTO]) -> Tuple[Dict[str, List[int]], Dict[str, List[int]]]:
+    """Positions of events grouped by client id and by event type."""
+    by_client: Dict[str, List[int]] = defaultdict(list)
+    by_type: Dict[str, List[int]] = defaultdict(list)
+    for i, e in enumerate(_events):
+        by_client[e.client_id].append(i)
+        by_type[e.event_type].append(i)
+    return dict(by_client), dict(by_type)
 
 
 def get_related_events(event: EventDTO, all_events: List[EventDTO], limit: int = 5) -> List[EventDTO]:
     """Find related events (same client or similar type)."""
-    related = []
+    by_client, by_type = _events_index(_events_version(all_events), all_events)
 
     # Same client events
-    same_client = [e for e in all_events
-                   if e.client_id == event.client_id and e.id != event.id]
-    related.extend(same_client[:3])
+    same_client = (all_events[i] for i in by_client.get(event.client_id, ())
+                   if all_events[i].id != event.id)
+    related = list(islice(same_client, 3))
 
     # Similar type events
     if len(related) < limit:
-        same_type = [e for e in all_events
-                    if e.event_type == event.event_type
-                    and e.id != event.id
-                    and e.client_id != event.client_id]
-        needed = limit - len(related)
-        related.extend(same_type[:needed])
+        same_type = (all_events[i] for i in by_type.get(event.event_type, ())
+                     if all_events[i].id != event.id
+                     and all_events[i].client_id != event.client_id)
+        related.extend(islice(same_type, limit - len(related)))
 
     return related[:limit]
 
@@ -82,15 +242,7 @@ def render_event_detail_modal(event: EventDTO, client_name: str, storage: SQLite
 
     with col2:
         # Relevance badge
-        if event.relevance_score >= 0.7:
-            relevance_color = "#10b981"
-            relevance_label = "High"
-        elif event.relevance_score >= 0.4:
-            relevance_color = "#f59e0b"
-            relevance_label = "Medium"
-        else:
-            relevance_color = "#6b7280"
-            relevance_label = "Low"
+        relevance_color, relevance_label = relevance_band(event.relevance_score)
 
         st.markdown(f"""
         <div style="text-align: right;">
@@ -128,8 +280,7 @@ def render_event_detail_modal(event: EventDTO, client_name: str, storage: SQLite
                 st.caption(f"Score: {event.sentiment_score:.2f}")
 
         with meta_col2:
-            status_icons = {"new": "🆕", "reviewed": "👁️", "actioned": "✅", "archived": "📦"}
-            st.write(f"**Status:** {status_icons.get(event.status, '📌')} {event.status.capitalize()}")
+            st.write(f"**Status:** {STATUS_ICONS.get(event.status, '📌')} {event.status.capitalize()}")
 
         with meta_col3:
             if event.source_name:
@@ -150,32 +301,40 @@ def render_event_detail_modal(event: EventDTO, client_name: str, storage: SQLite
                     st.markdown(f"`{tag}`")
 
         # Add new tag
-        new_tag_col1, new_tag_col2 = st.columns([3, 1])
-        with new_tag_col1:
-            new_tag = st.text_input("Add tag", key=f"new_tag_{event.id}", label_visibility="collapsed",
-                                   placeholder="Enter new tag...")
-        with new_tag_col2:
-            if st.button("➕ Add", key=f"add_tag_{event.id}") and new_tag:
-                updated_tags = list(event.tags) if event.tags else []
-                if new_tag not in updated_tags:
-                    updated_tags.append(new_tag)
-                    storage.update_event(event.id, {"tags": updated_tags})
-                    st.success(f"Tag '{new_tag}' added!")
-                    st.rerun()
+        with st.form(f"tag_form_{event.id}", clear_on_submit=True, border=False):
+            new_tag_col1, new_tag_col2 = st.columns([3, 1])
+            with new_tag_col1:
+                new_tag = st.text_input("Add tag", key=f"new_tag_{event.id}", label_visibility="collapsed",
+                                       placeholder="Enter new tag...")
+            with new_tag_col2:
+                add_tag = st.form_submit_button("➕ Add")
+
+        if add_tag and new_tag:
+            updated_tags = list(event.tags) if event.tags else []
+            if new_tag not in updated_tags:
+                updated_tags.append(new_tag)
+                storage.update_event(event.id, {"tags": updated_tags})
+                _invalidate_filtered_events()
+                st.success(f"Tag '{new_tag}' added!")
+                st.rerun()
 
         # Notes
         st.divider()
         st.subheader("📝 Notes")
-        notes = st.text_area(
-            "Event notes",
-            value=event.user_notes or "",
-            height=150,
-            key=f"detail_notes_{event.id}",
-            placeholder="Add your notes here...",
-            label_visibility="collapsed"
-        )
-        if st.button("💾 Save Notes", key=f"save_detail_notes_{event.id}", type="primary"):
+        with st.form(f"notes_form_{event.id}", border=False):
+            notes = st.text_area(
+                "Event notes",
+                value=event.user_notes or "",
+                height=150,
+                key=f"detail_notes_{event.id}",
+                placeholder="Add your notes here...",
+                label_visibility="collapsed"
+            )
+            save_notes = st.form_submit_button("💾 Save Notes", type="primary")
+
+        if save_notes:
             storage.update_event(event.id, {"user_notes": notes})
+            _invalidate_filtered_events()
             st.success("✅ Notes saved!")
             st.rerun()
 
@@ -183,20 +342,21 @@ def render_event_detail_modal(event: EventDTO, client_name: str, storage: SQLite
         # Quick actions
         st.subheader("⚡ Quick Actions")
 
-        if event.status != "reviewed":
-            if st.button("👁️ Mark as Reviewed", key=f"detail_review_{event.id}", use_container_width=True):
-                storage.update_event(event.id, {"status": "reviewed"})
-                st.rerun()
-
-        if event.status != "actioned":
-            if st.button("✅ Mark as Actioned", key=f"detail_action_{event.id}", use_container_width=True):
-                storage.update_event(event.id, {"status": "actioned"})
-                st.rerun()
+        statuses = list(STATUS_ICONS)
+        with st.form(f"status_form_{event.id}", border=False):
+            new_status = st.radio(
+                "Status",
+                options=statuses,
+                index=statuses.index(event.status) if event.status in statuses else 0,
+                format_func=lambda s: f"{STATUS_ICONS[s]} {s.capitalize()}",
+                key=f"detail_status_{event.id}",
+            )
+            apply_status = st.form_submit_button("Apply Status", use_container_width=True)
 
-        if event.status != "archived":
-            if st.button("📦 Archive", key=f"detail_archive_{event.id}", use_container_width=True):
-                storage.update_event(event.id, {"status": "archived"})
-                st.rerun()
+        if apply_status and new_status != event.status:
+            storage.update_event(event.id, {"status": new_status})
+            _invalidate_filtered_events()
+            st.rerun()
 
         if st.button("🗑️ Delete Event", key=f"detail_delete_{event.id}", type="secondary", use_container_width=True):
             st.session_state.confirm_delete_detail = True
@@ -207,6 +367,7 @@ def render_event_detail_modal(event: EventDTO, client_name: str, storage: SQLite
             with col1:
                 if st.button("Yes", key=f"yes_delete_detail_{event.id}", type="primary"):
                     storage.delete_event(event.id)
+                    _invalidate_filtered_events()
                     del st.session_state.viewing_event_id
                     if "confirm_delete_detail" in st.session_state:
                         del st.session_state.confirm_delete_detail
@@ -223,9 +384,9 @@ def render_event_detail_modal(event: EventDTO, client_name: str, storage: SQLite
         related = get_related_events(event, all_events)
 
         if related:
+            related_names = _event_client_names(storage, related)
             for rel_event in related:
-                rel_client = storage.get_client(rel_event.client_id)
-                rel_client_name = rel_client.name if rel_client else "Unknown"
+                rel_client_name = related_names.get(rel_event.client_id, "Unknown")
                 rel_config = EVENT_TYPE_CONFIG.get(rel_event.event_type, EVENT_TYPE_CONFIG["other"])
 
                 with st.expander(f"{rel_config['icon']} {rel_client_name}", expanded=False):
@@ -237,36 +398,73 @@ def render_event_detail_modal(event: EventDTO, client_name: str, storage: SQLite
             st.info("No related events found")
 
 
+@st.cache_data
+def _quick_stats(events_version: int, _events: List[EventDTO]) -> Dict[str, Any]:
+    """Total, new count, mean relevance and most common type for an events list."""
+    if not _events:
+        return {"total": 0, "new": 0, "avg_relevance": None, "most_common": None}
+
+    df = _events_df(events_version, _events)
+    # Appearance-ordered counts so ties resolve to the first type seen
+    type_counts = df["event_type"].astype(object).value_counts(sort=False)
+    return {
+        "total": len(df),
+        "new": int((df["status"] == "new").sum()),
+        "avg_relevance": float(df["relevance_score"].mean()),
+        "most_common": type_counts.idxmax(),
+    }
+
+
 def render_quick_stats(events: List[EventDTO]):
     """Render quick stats bar at the top."""
+    stats = _quick_stats(_events_version(events), events)
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("📊 Total Events", len(events))
+        st.metric("📊 Total Events", stats["total"])
 
     with col2:
-        new_count = len([e for e in events if e.status == "new"])
-        st.metric("🆕 New", new_count)
+        st.metric("🆕 New", stats["new"])
 
     with col3:
-        if events:
-            avg_relevance = sum(e.relevance_score for e in events) / len(events)
-            st.metric("⭐ Avg Relevance", f"{avg_relevance:.2f}")
+        if stats["avg_relevance"] is not None:
+            st.metric("⭐ Avg Relevance", f"{stats['avg_relevance']:.2f}")
         else:
             st.metric("⭐ Avg Relevance", "—")
 
     with col4:
-        if events:
-            type_counts = defaultdict(int)
-            for e in events:
-                type_counts[e.event_type] += 1
-            most_common = max(type_counts.items(), key=lambda x: x[1])
-            config = EVENT_TYPE_CONFIG.get(most_common[0], EVENT_TYPE_CONFIG["other"])
+        if stats["most_common"] is not None:
+            config = EVENT_TYPE_CONFIG.get(stats["most_common"], EVENT_TYPE_CONFIG["other"])
             st.metric("🔥 Most Common", f"{config['icon']} {config['label']}")
         else:
             st.metric("🔥 Most Common", "—")
 
 
+def _filters_key(filters: Dict[str, Any]) -> tuple:
+    """Hashable identity of the sidebar filters (date by preset, not timestamp)."""
+    return (
+        filters["search_term"],
+        filters["date_preset"],
+        tuple(filters["selected_clients"]),
+        tuple(filters["selected_event_types"]),
+        tuple(filters["selected_sentiments"]),
+        tuple(filters["selected_statuses"]),
+        filters["min_relevance"],
+    )
+
+
+def _invalidate_filtered_events():
+    """Make the next run reload the filtered events (call after any event write)."""
+    st.session_state.pop("events_filter_key", None)
+
+
+def _clear_event_selection():
+    """Drop the selection and the list-view editors that would otherwise re-tick it."""
+    for key in [k for k in st.session_state if k.startswith("selected_events_page_")]:
+        del st.session_state[key]
+    st.session_state.selected_events = set()
+
+
 def render_bulk_actions(selected_event_ids: List[str], storage: SQLiteStorage):
     """Render bulk actions UI."""
     if not selected_event_ids:
@@ -289,7 +487,7 @@ def render_bulk_actions(selected_event_ids: List[str], storage: SQLiteStorage):
 
     with col3:
         if st.button("✕ Clear Selection", use_container_width=True):
-            st.session_state.selected_events = []
+            _clear_event_selection()
             st.rerun()
 
     # Confirmation for bulk actions
@@ -298,25 +496,20 @@ def render_bulk_actions(selected_event_ids: List[str], storage: SQLiteStorage):
 
         if action == "Export Selected":
             # Export immediately without confirmation
-            events_to_export = []
-            for event_id in selected_event_ids:
-                event = storage.get_event(event_id)
-                if event:
-                    client = storage.get_client(event.client_id)
-                    events_to_export.append({
-                        "Client": client.name if client else "Unknown",
-                        "Title": event.title,
-                        "Type": event.event_type,
-                        "Date": event.published_date.strftime("%Y-%m-%d"),
-                        "Relevance": event.relevance_score,
-                        "Sentiment": event.sentiment,
-                        "Status": event.status,
-                        "Summary": event.summary or "",
-                        "Notes": event.user_notes or "",
-                    })
-
-            df = pd.DataFrame(events_to_export)
-            csv = df.to_csv(index=False)
+            events = storage.get_events_by_ids(selected_event_ids)
+            client_names = _event_client_names(storage, events)
+            df = pd.DataFrame({
+                "Client": [client_names.get(e.client_id, "Unknown") for e in events],
+                "Title": [e.title for e in events],
+                "Type": [e.event_type for e in events],
+                "Date": [e.published_date.strftime("%Y-%m-%d") for e in events],
+                "Relevance": [e.relevance_score for e in events],
+                "Sentiment": [e.sentiment for e in events],
+                "Status": [e.status for e in events],
+                "Summary": [e.summary or "" for e in events],
+                "Notes": [e.user_notes or "" for e in events],
+            })
+            csv = df.to_csv(index=False).encode("utf-8")
             st.download_button(
                 label="📥 Download CSV",
                 data=csv,
@@ -331,17 +524,17 @@ def render_bulk_actions(selected_event_ids: List[str], storage: SQLiteStorage):
 
             with col1:
                 if st.button("✅ Confirm", key="confirm_bulk", type="primary", use_container_width=True):
-                    for event_id in selected_event_ids:
-                        if action == "Mark as Reviewed":
-                            storage.update_event(event_id, {"status": "reviewed"})
-                        elif action == "Mark as Actioned":
-                            storage.update_event(event_id, {"status": "actioned"})
-                        elif action == "Archive All":
-                            storage.update_event(event_id, {"status": "archived"})
-                        elif action == "Delete All":
-                            storage.delete_event(event_id)
-
-                    st.session_state.selected_events = []
+                    if action == "Mark as Reviewed":
+                        storage.bulk_update_event_status(selected_event_ids, "reviewed")
+                    elif action == "Mark as Actioned":
+                        storage.bulk_update_event_status(selected_event_ids, "actioned")
+                    elif action == "Archive All":
+                        storage.bulk_update_event_status(selected_event_ids, "archived")
+                    elif action == "Delete All":
+                        storage.bulk_delete_events(selected_event_ids)
+
+                    _clear_event_selection()
+                    _invalidate_filtered_events()
                     del st.session_state.confirm_bulk_action
                     st.success(f"✅ {action} completed!")
                     st.rerun()
@@ -388,8 +581,7 @@ def render_filters_sidebar(storage: SQLiteStorage) -> Dict[str, Any]:
     st.sidebar.divider()
 
     # Client filter
-    all_clients = storage.get_all_clients()
-    client_options = ["All Clients"] + [c.name for c in all_clients]
+    client_options = ["All Clients"] + list(_clients_by_name(storage))
     selected_clients = st.sidebar.multiselect(
         "📊 Clients",
         options=client_options,
@@ -397,28 +589,23 @@ def render_filters_sidebar(storage: SQLiteStorage) -> Dict[str, Any]:
     )
 
     # Event type filter
-    event_type_labels = [f"{config['icon']} {config['label']}"
-                         for config in EVENT_TYPE_CONFIG.values()]
     selected_event_types = st.sidebar.multiselect(
         "🏷️ Event Types",
-        options=["All Types"] + event_type_labels,
+        options=["All Types"] + list(EVENT_LABEL_TO_KEY),
         default=["All Types"]
     )
 
     # Sentiment filter
-    sentiment_options = [f"{config['emoji']} {sentiment.capitalize()}"
-                        for sentiment, config in SENTIMENT_CONFIG.items()]
     selected_sentiments = st.sidebar.multiselect(
         "😊 Sentiment",
-        options=["All Sentiments"] + sentiment_options,
+        options=["All Sentiments"] + list(SENTIMENT_LABEL_TO_KEY),
         default=["All Sentiments"]
     )
 
     # Status filter
-    status_options = ["New", "Reviewed", "Actioned", "Archived"]
     selected_statuses = st.sidebar.multiselect(
         "📋 Status",
-        options=["All Statuses"] + status_options,
+        options=["All Statuses"] + list(STATUS_MAP),
         default=["All Statuses"]
     )
 
@@ -445,6 +632,7 @@ def render_filters_sidebar(storage: SQLiteStorage) -> Dict[str, Any]:
 
     return {
         "search_term": search_term,
+        "date_preset": date_preset,
         "from_date": from_date,
         "selected_clients": selected_clients,
         "selected_event_types": selected_event_types,
@@ -454,99 +642,56 @@ def render_filters_sidebar(storage: SQLiteStorage) -> Dict[str, Any]:
     }
 
 
-def apply_filters(events: List[EventDTO], filters: Dict[str, Any], storage: SQLiteStorage) -> List[EventDTO]:
-    """Apply all filters to events list."""
-    filtered = events.copy()
-
-    # Search filter
-    if filters["search_term"]:
-        search_lower = filters["search_term"].lower()
-        filtered = [e for e in filtered
-                   if (search_lower in e.title.lower()) or
-                      (e.summary and search_lower in e.summary.lower())]
+def _filter_query(filters: Dict[str, Any], storage: SQLiteStorage) -> Dict[str, Any]:
+    """Translate the sidebar filters into `SQLiteStorage.query_events` arguments."""
+    client_ids = event_types = sentiments = statuses = None
 
-    # Date filter
-    if filters["from_date"]:
-        filtered = [e for e in filtered if e.discovered_date >= filters["from_date"]]
-
-    # Client filter
     if "All Clients" not in filters["selected_clients"] and filters["selected_clients"]:
-        client_ids = []
-        for client_name in filters["selected_clients"]:
-            clients = [c for c in storage.get_all_clients() if c.name == client_name]
-            if clients:
-                client_ids.append(clients[0].id)
-        filtered = [e for e in filtered if e.client_id in client_ids]
+        name_map = _clients_by_name(storage)
+        client_ids = [name_map[n] for n in filters["selected_clients"] if n in name_map]
 
-    # Event type filter
     if "All Types" not in filters["selected_event_types"] and filters["selected_event_types"]:
-        selected_types = []
-        for label in filters["selected_event_types"]:
-            for event_type, config in EVENT_TYPE_CONFIG.items():
-                if config["label"] in label:
-                    selected_types.append(event_type)
-        filtered = [e for e in filtered if e.event_type in selected_types]
+        event_types = [EVENT_LABEL_TO_KEY[l] for l in filters["selected_event_types"]
+                       if l in EVENT_LABEL_TO_KEY]
 
-    # Sentiment filter
     if "All Sentiments" not in filters["selected_sentiments"] and filters["selected_sentiments"]:
-        selected_sentiments = []
-        for label in filters["selected_sentiments"]:
-            for sentiment in SENTIMENT_CONFIG.keys():
-                if sentiment.capitalize() in label:
-                    selected_sentiments.append(sentiment)
-        filtered = [e for e in filtered if e.sentiment in selected_sentiments]
+        sentiments = [SENTIMENT_LABEL_TO_KEY[l] for l in filters["selected_sentiments"]
+                      if l in SENTIMENT_LABEL_TO_KEY]
 
-    # Status filter
     if "All Statuses" not in filters["selected_statuses"] and filters["selected_statuses"]:
-        status_map = {"New": "new", "Reviewed": "reviewed", "Actioned": "actioned", "Archived": "archived"}
-        selected_statuses = [status_map[s] for s in filters["selected_statuses"]]
-        filtered = [e for e in filtered if e.status in selected_statuses]
+        statuses = [STATUS_MAP[s] for s in filters["selected_statuses"]]
+
+    return {
+        "search": filters["search_term"] or None,
+        "from_date": filters["from_date"],
+        "client_ids": client_ids,
+        "event_types": event_types,
+        "sentiments": sentiments,
+        "statuses": statuses,
+        "min_relevance": filters["min_relevance"],
+    }
 
-    # Relevance filter
-    filtered = [e for e in filtered if e.relevance_score >= filters["min_relevance"]]
 
-    return filtered
+def apply_filters(filters: Dict[str, Any], storage: SQLiteStorage) -> List[EventDTO]:
+    """Load the events matching the sidebar filters with a single SQL query."""
+    return storage.query_events(**_filter_query(filters, storage))
 
 
-def render_event_card_compact(event: EventDTO, client_name: str, storage: SQLiteStorage,
-                              search_term: str = "", show_checkbox: bool = True):
-    """Render a compact event card for list view."""
+def render_event_card_compact(event: EventDTO, client_name: str, storage: SQLiteStorage, search_term: str = ""):
+    """Render a compact event card for the timeline view."""
     config = EVENT_TYPE_CONFIG.get(event.event_type, EVENT_TYPE_CONFIG["other"])
     sentiment_config = SENTIMENT_CONFIG.get(event.sentiment, SENTIMENT_CONFIG["neutral"])
 
-    # Relevance color
-    if event.relevance_score >= 0.7:
-        relevance_color = "#10b981"
-    elif event.relevance_score >= 0.4:
-        relevance_color = "#f59e0b"
-    else:
-        relevance_color = "#6b7280"
+    relevance_color, _ = relevance_band(event.relevance_score)
 
     with st.container(border=True):
-        # Header row with checkbox
-        header_cols = st.columns([0.3, 3, 1, 1]) if show_checkbox else st.columns([3, 1, 1])
-
-        col_idx = 0
-        if show_checkbox:
-            with header_cols[col_idx]:
-                selected = st.checkbox(
-                    "Select",
-                    key=f"select_{event.id}",
-                    value=event.id in st.session_state.get("selected_events", []),
-                    label_visibility="collapsed"
-                )
-                if selected and event.id not in st.session_state.get("selected_events", []):
-                    if "selected_events" not in st.session_state:
-                        st.session_state.selected_events = []
-                    st.session_state.selected_events.append(event.id)
-                elif not selected and event.id in st.session_state.get("selected_events", []):
-                    st.session_state.selected_events.remove(event.id)
-            col_idx = 1
-
-        with header_cols[col_idx]:
+        # Header row
+        header_cols = st.columns([3, 1, 1])
+
+        with header_cols[0]:
             st.markdown(f"**{client_name}** · {config['icon']} {config['label']}")
 
-        with header_cols[col_idx + 1]:
+        with header_cols[1]:
             days_ago = (datetime.utcnow() - event.published_date).days
             if days_ago == 0:
                 date_str = "Today"
@@ -556,7 +701,7 @@ def render_event_card_compact(event: EventDTO, client_name: str, storage: SQLite
                 date_str = f"{days_ago}d ago"
             st.caption(date_str)
 
-        with header_cols[col_idx + 2]:
+        with header_cols[2]:
             st.markdown(f"""
             <div style="text-align: right;">
                 <span style="background-color: {relevance_color}; color: white;
@@ -585,8 +730,7 @@ def render_event_card_compact(event: EventDTO, client_name: str, storage: SQLite
             st.write(f"{sentiment_config['emoji']} {event.sentiment.capitalize()}")
 
         with col2:
-            status_icons = {"new": "🆕", "reviewed": "👁️", "actioned": "✅", "archived": "📦"}
-            st.write(f"{status_icons.get(event.status, '📌')} {event.status.capitalize()}")
+            st.write(f"{STATUS_ICONS.get(event.status, '📌')} {event.status.capitalize()}")
 
         with col3:
             if event.source_name:
@@ -606,16 +750,19 @@ def render_event_card_compact(event: EventDTO, client_name: str, storage: SQLite
         with action_cols[0]:
             if event.status != "reviewed" and st.button("✓ Reviewed", key=f"review_{event.id}", use_container_width=True):
                 storage.update_event(event.id, {"status": "reviewed"})
+                _invalidate_filtered_events()
                 st.rerun()
 
         with action_cols[1]:
             if event.status != "actioned" and st.button("✓ Actioned", key=f"action_{event.id}", use_container_width=True):
                 storage.update_event(event.id, {"status": "actioned"})
+                _invalidate_filtered_events()
                 st.rerun()
 
         with action_cols[2]:
             if event.status != "archived" and st.button("📦 Archive", key=f"archive_{event.id}", use_container_width=True):
                 storage.update_event(event.id, {"status": "archived"})
+                _invalidate_filtered_events()
                 st.rerun()
 
         with action_cols[3]:
@@ -629,7 +776,7 @@ def render_event_card_compact(event: EventDTO, client_name: str, storage: SQLite
 
 
 def render_list_view(events: List[EventDTO], storage: SQLiteStorage, search_term: str = ""):
-    """Render events in list view with checkboxes."""
+    """Render events in list view as one selectable table per page."""
     if not events:
         st.info("📭 No events found matching your filters")
         return
@@ -643,40 +790,97 @@ def render_list_view(events: List[EventDTO], storage: SQLiteStorage, search_term
             label_visibility="collapsed"
         )
 
+    client_names = _event_client_names(storage, events)
+
     # Sort events
-    if sort_by == "Relevance (High to Low)":
-        events_sorted = sorted(events, key=lambda e: e.relevance_score, reverse=True)
-    elif sort_by == "Date (Newest First)":
-        events_sorted = sorted(events, key=lambda e: e.published_date, reverse=True)
-    elif sort_by == "Date (Oldest First)":
-        events_sorted = sorted(events, key=lambda e: e.published_date)
-    else:  # Client Name
-        events_sorted = sorted(events, key=lambda e: storage.get_client(e.client_id).name if storage.get_client(e.client_id) else "")
+    version = _events_version(events)
+    order = _sorted_indices(version, sort_by, events, client_names)
 
     # Initialize selected_events in session state
     if "selected_events" not in st.session_state:
-        st.session_state.selected_events = []
+        st.session_state.selected_events = set()
 
-    # Bulk actions bar
-    render_bulk_actions(st.session_state.selected_events, storage)
+    # Bulk actions bar (filled after the table so it sees this run's ticks)
+    bulk_bar = st.container()
 
     st.divider()
 
     # Pagination
     items_per_page = 20
-    total_pages = (len(events_sorted) + items_per_page - 1) // items_per_page
+    total_pages = (len(order) + items_per_page - 1) // items_per_page
 
     if "events_page" not in st.session_state:
         st.session_state.events_page = 1
 
     start_idx = (st.session_state.events_page - 1) * items_per_page
-    end_idx = min(start_idx + items_per_page, len(events_sorted))
+    end_idx = min(start_idx + items_per_page, len(order))
 
     # Render events
-    for event in events_sorted[start_idx:end_idx]:
-        client = storage.get_client(event.client_id)
-        client_name = client.name if client else "Unknown Client"
-        render_event_card_compact(event, client_name, storage, search_term, show_checkbox=True)
+    page_events = [events[i] for i in order[start_idx:end_idx]]
+    selected = st.session_state.selected_events
+    now = datetime.utcnow()
+
+    rows = []
+    for event in page_events:
+        config = EVENT_TYPE_CONFIG.get(event.event_type, EVENT_TYPE_CONFIG["other"])
+        sentiment_config = SENTIMENT_CONFIG.get(event.sentiment, SENTIMENT_CONFIG["neutral"])
+        days_ago = (now - event.published_date).days
+        rows.append({
+            "Select": event.id in selected,
+            "Client": client_names.get(event.client_id, "Unknown Client"),
+            "Type": f"{config['icon']} {config['label']}",
+            "Title": event.title,
+            "Date": "Today" if days_ago == 0 else "Yesterday" if days_ago == 1 else f"{days_ago}d ago",
+            "Relevance": event.relevance_score,
+            "Sentiment": f"{sentiment_config['emoji']} {event.sentiment.capitalize()}",
+            "Status": f"{STATUS_ICONS.get(event.status, '📌')} {event.status.capitalize()}",
+            "Notes": "📝" if event.user_notes else "",
+            "Source": event.source_url or None,
+        })
+    table = pd.DataFrame(rows, index=[e.id for e in page_events])
+
+    # Highlight titles matching the search term
+    styled = table.style
+    if search_term:
+        pattern = _highlight_pattern(search_term)
+        styled = styled.map(lambda title: "background-color: #fef08a" if pattern.search(title) else "",
+                            subset=["Title"])
+
+    # The editor stores ticks by row position, so its key changes with
+    # anything that reorders or replaces the rows
+    edited = st.data_editor(
+        styled,
+        key=f"selected_events_page_{st.session_state.events_page}_{sort_by}_{version}",
+        hide_index=True,
+        use_container_width=True,
+        disabled=[col for col in table.columns if col != "Select"],
+        column_config={
+            "Select": st.column_config.CheckboxColumn("✓", width="small"),
+            "Title": st.column_config.TextColumn("Title", width="large"),
+            "Relevance": st.column_config.ProgressColumn("Relevance", format="%.2f", min_value=0.0, max_value=1.0),
+            "Source": st.column_config.LinkColumn("Source", display_text="🔗"),
+        },
+    )
+
+    for event_id, ticked in edited["Select"].items():
+        if ticked:
+            selected.add(event_id)
+        else:
+            selected.discard(event_id)
+
+    with bulk_bar:
+        render_bulk_actions(sorted(selected), storage)
+
+    # Single detail opener instead of per-row buttons
+    detail_col1, detail_col2 = st.columns([4, 1])
+    with detail_col1:
+        titles = {e.id: f"{client_names.get(e.client_id, 'Unknown Client')} · {e.title}" for e in page_events}
+        detail_id = st.selectbox("Open event", options=list(titles), format_func=titles.get,
+                                 label_visibility="collapsed")
+    with detail_col2:
+        if st.button("ℹ️ Details", key="list_open_details", use_container_width=True):
+            st.session_state.viewing_event_id = detail_id
+            st.rerun()
 
     # Pagination controls
     if total_pages > 1:
@@ -698,20 +902,33 @@ def render_list_view(events: List[EventDTO], storage: SQLiteStorage, search_term
                 st.rerun()
 
 
-def render_timeline_view(events: List[EventDTO], storage: SQLiteStorage):
+def render_timeline_view(events: List[EventDTO], storage: SQLiteStorage, search_term: str = ""):
     """Render events in timeline view."""
     if not events:
         st.info("📭 No events found matching your filters")
         return
 
-    # Group by date
-    events_by_date = defaultdict(list)
-    for event in sorted(events, key=lambda e: e.published_date, reverse=True):
-        date_key = event.published_date.strftime("%Y-%m-%d")
-        events_by_date[date_key].append(event)
+    client_names = _event_client_names(storage, events)
+
+    # Group by date (newest first); rows keep their position in events
+    version = _events_version(events)
+    df = _events_df(version, events)
+    timeline = df.iloc[_sorted_indices(version, "Date (Newest First)", events, client_names)]
+    groups = list(timeline.groupby(timeline["published_date"].dt.strftime("%Y-%m-%d"), sort=False))
+
+    # Pagination by date
+    dates_per_page = 7
+    cards_per_date = 10
+    total_pages = (len(groups) + dates_per_page - 1) // dates_per_page
+
+    if "timeline_page" not in st.session_state:
+        st.session_state.timeline_page = 1
+    st.session_state.timeline_page = min(st.session_state.timeline_page, total_pages)
+
+    start_idx = (st.session_state.timeline_page - 1) * dates_per_page
 
     # Render timeline
-    for date_str, date_events in events_by_date.items():
+    for date_str, group in groups[start_idx:start_idx + dates_per_page]:
         date_obj = datetime.strptime(date_str, "%Y-%m-%d")
         days_ago = (datetime.utcnow() - date_obj).days
 
@@ -723,15 +940,45 @@ def render_timeline_view(events: List[EventDTO], storage: SQLiteStorage):
             date_label = date_obj.strftime("%B %d, %Y")
 
         st.markdown(f"### 📅 {date_label}")
-        st.caption(f"{len(date_events)} event(s)")
+        st.caption(f"{len(group)} event(s)")
 
-        for event in date_events:
-            client = storage.get_client(event.client_id)
-            client_name = client.name if client else "Unknown Client"
-            render_event_card_compact(event, client_name, storage, show_checkbox=False)
+        # Busy days show the most relevant cards; the rest only on request
+        positions = group.index
+        if len(positions) > cards_per_date:
+            positions = group["relevance_score"].sort_values(ascending=False, kind="stable").index
+
+        for i in positions[:cards_per_date]:
+            event = events[i]
+            render_event_card_compact(event, client_names.get(event.client_id, "Unknown Client"), storage, search_term)
+
+        hidden = positions[cards_per_date:]
+        if len(hidden) and st.toggle(f"Show all {len(group)}", key=f"timeline_all_{date_str}"):
+            for i in hidden:
+                event = events[i]
+                render_event_card_compact(event, client_names.get(event.client_id, "Unknown Client"),
+                                          storage, search_term)
 
         st.divider()
 
+    # Pagination controls
+    if total_pages > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+
+        with col1:
+            if st.button("◀ Newer", key="timeline_prev", disabled=st.session_state.timeline_page == 1):
+                st.session_state.timeline_page -= 1
+                st.rerun()
+
+        with col2:
+            st.markdown(f"<div style='text-align: center;'>Page {st.session_state.timeline_page} of {total_pages}</div>",
+                       unsafe_allow_html=True)
+
+        with col3:
+            if st.button("Older ▶", key="timeline_next",
+                         disabled=st.session_state.timeline_page == total_pages):
+                st.session_state.timeline_page += 1
+                st.rerun()
+
 
 def render_table_view(events: List[EventDTO], storage: SQLiteStorage):
     """Render events in table view."""
@@ -739,26 +986,21 @@ def render_table_view(events: List[EventDTO], storage: SQLiteStorage):
         st.info("📭 No events found matching your filters")
         return
 
-    # Prepare data
-    data = []
-    for event in events:
-        client = storage.get_client(event.client_id)
-        client_name = client.name if client else "Unknown"
+    client_names = _event_client_names(storage, events)
+    events_df = _events_df(_events_version(events), events)
 
-        config = EVENT_TYPE_CONFIG.get(event.event_type, EVENT_TYPE_CONFIG["other"])
-
-        data.append({
-            "Client": client_name,
-            "Title": event.title[:60] + "..." if len(event.title) > 60 else event.title,
-            "Type": f"{config['icon']} {config['label']}",
-            "Date": event.published_date.strftime("%Y-%m-%d"),
-            "Relevance": event.relevance_score,
-            "Sentiment": event.sentiment.capitalize(),
-            "Status": event.status.capitalize(),
-            "Source": event.source_name or "—",
-        })
-
-    df = pd.DataFrame(data)
+    # Prepare data
+    title = events_df["title"]
+    df = pd.DataFrame({
+        "Client": events_df["client_id"].astype(object).map(client_names).fillna("Unknown"),
+        "Title": title.where(title.str.len() <= 60, title.str.slice(0, 60) + "..."),
+        "Type": events_df["event_type"].astype(object).map(EVENT_TYPE_LABELS).fillna(EVENT_TYPE_LABELS["other"]),
+        "Date": events_df["published_date"].dt.strftime("%Y-%m-%d"),
+        "Relevance": events_df["relevance_score"],
+        "Sentiment": events_df["sentiment"].astype(str).str.capitalize(),
+        "Status": events_df["status"].astype(str).str.capitalize(),
+        "Source": events_df["source_name"].astype(object).replace("", "—"),
+    })
 
     # Display table
     st.dataframe(
@@ -785,36 +1027,80 @@ def render_table_view(events: List[EventDTO], storage: SQLiteStorage):
     )
 
 
-def render_analytics_view(events: List[EventDTO], storage: SQLiteStorage):
+@dataclass
+class AnalyticsBundle:
+    """Chart-ready results behind the analytics view."""
+    total: int
+    new_count: int
+    reviewed_count: int
+    avg_relevance: float
+    unique_clients: int
+    positive_pct: float
+    type_counts: pd.Series
+    sentiment_counts: pd.Series
+    top_clients: pd.Series
+    top_sources: pd.Series
+    relevance_bins: pd.Series
+
+
+@st.cache_data(show_spinner=False)
+def _compute_analytics(events_version: int, query: Dict[str, Any], _events: List[EventDTO],
+                       _storage: SQLiteStorage) -> AnalyticsBundle:
+    """Every count and average in the analytics view, computed in one cached pass."""
+    df = _events_df(events_version, _events)
+    status_counts = df["status"].value_counts()
+
+    type_counts = df["event_type"].astype(object).value_counts(sort=False)
+    type_labels = type_counts.index.map(lambda t: EVENT_TYPE_CONFIG.get(t, EVENT_TYPE_CONFIG["other"])["label"])
+    sentiment_counts = df["sentiment"].astype(object).value_counts(sort=False)
+
+    top_clients = _storage.top_clients_by_events(limit=10, **query)
+    top_sources = _storage.top_sources_by_events(limit=10, **query)
+
+    relevance_bins = np.bincount(np.digitize(df["relevance_score"].to_numpy(), RELEVANCE_EDGES),
+                                 minlength=len(RELEVANCE_RANGES))
+
+    return AnalyticsBundle(
+        total=len(df),
+        new_count=int(status_counts.get("new", 0)),
+        reviewed_count=int(status_counts.get("reviewed", 0)),
+        avg_relevance=float(df["relevance_score"].mean()),
+        unique_clients=df["client_id"].nunique(),
+        positive_pct=float(df["sentiment"].eq("positive").mean() * 100),
+        type_counts=type_counts.groupby(type_labels, sort=False).sum().rename_axis("Type").rename("Count"),
+        sentiment_counts=sentiment_counts.rename(index=str.capitalize).rename_axis("Sentiment").rename("Count"),
+        top_clients=pd.Series(dict(top_clients), dtype="int64").rename_axis("Client").rename("Events"),
+        top_sources=pd.Series(dict(top_sources), dtype="int64").rename_axis("Source").rename("Events"),
+        relevance_bins=pd.Series(relevance_bins, index=RELEVANCE_RANGES).rename_axis("Range").rename("Count"),
+    )
+
+
+def render_analytics_view(events: List[EventDTO], storage: SQLiteStorage, query: Dict[str, Any]):
     """Render analytics and charts."""
     if not events:
         st.info("📭 No events found matching your filters")
         return
 
+    bundle = _compute_analytics(_events_version(events), query, events, storage)
+
     # Summary metrics (duplicates quick stats, but with more detail)
     st.subheader("📊 Overview")
     col1, col2, col3, col4, col5 = st.columns(5)
 
     with col1:
-        st.metric("Total Events", len(events))
+        st.metric("Total Events", bundle.total)
 
     with col2:
-        new_count = len([e for e in events if e.status == "new"])
-        reviewed_count = len([e for e in events if e.status == "reviewed"])
-        st.metric("New / Reviewed", f"{new_count} / {reviewed_count}")
+        st.metric("New / Reviewed", f"{bundle.new_count} / {bundle.reviewed_count}")
 
     with col3:
-        avg_relevance = sum(e.relevance_score for e in events) / len(events)
-        st.metric("Avg Relevance", f"{avg_relevance:.2f}")
+        st.metric("Avg Relevance", f"{bundle.avg_relevance:.2f}")
 
     with col4:
-        unique_clients = len(set(e.client_id for e in events))
-        st.metric("Unique Clients", unique_clients)
+        st.metric("Unique Clients", bundle.unique_clients)
 
     with col5:
-        positive_count = len([e for e in events if e.sentiment == "positive"])
-        positive_pct = (positive_count / len(events)) * 100
-        st.metric("Positive Sentiment", f"{positive_pct:.0f}%")
+        st.metric("Positive Sentiment", f"{bundle.positive_pct:.0f}%")
 
     st.divider()
 
@@ -823,27 +1109,11 @@ def render_analytics_view(events: List[EventDTO], storage: SQLiteStorage):
 
     with col1:
         st.subheader("📊 Events by Type")
-        type_counts = defaultdict(int)
-        for event in events:
-            type_counts[event.event_type] += 1
-
-        type_data = pd.DataFrame([
-            {"Type": EVENT_TYPE_CONFIG.get(t, EVENT_TYPE_CONFIG["other"])["label"], "Count": c}
-            for t, c in type_counts.items()
-        ])
-        st.bar_chart(type_data.set_index("Type"))
+        st.bar_chart(bundle.type_counts)
 
     with col2:
         st.subheader("😊 Sentiment Distribution")
-        sentiment_counts = defaultdict(int)
-        for event in events:
-            sentiment_counts[event.sentiment] += 1
-
-        sentiment_data = pd.DataFrame([
-            {"Sentiment": s.capitalize(), "Count": c}
-            for s, c in sentiment_counts.items()
-        ])
-        st.bar_chart(sentiment_data.set_index("Sentiment"))
+        st.bar_chart(bundle.sentiment_counts)
 
     st.divider()
 
@@ -851,27 +1121,12 @@ def render_analytics_view(events: List[EventDTO], storage: SQLiteStorage):
 
     with col1:
         st.subheader("🏆 Top Clients by Events")
-        client_counts = defaultdict(int)
-        for event in events:
-            client = storage.get_client(event.client_id)
-            if client:
-                client_counts[client.name] += 1
-
-        top_clients = sorted(client_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        client_data = pd.DataFrame(top_clients, columns=["Client", "Events"])
-        st.bar_chart(client_data.set_index("Client"))
+        st.bar_chart(bundle.top_clients)
 
     with col2:
         st.subheader("📰 Top Sources")
-        source_counts = defaultdict(int)
-        for event in events:
-            if event.source_name:
-                source_counts[event.source_name] += 1
-
-        top_sources = sorted(source_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        if top_sources:
-            source_data = pd.DataFrame(top_sources, columns=["Source", "Events"])
-            st.bar_chart(source_data.set_index("Source"))
+        if not bundle.top_sources.empty:
+            st.bar_chart(bundle.top_sources)
         else:
             st.info("No source data available")
 
@@ -879,29 +1134,38 @@ def render_analytics_view(events: List[EventDTO], storage: SQLiteStorage):
 
     # Relevance distribution
     st.subheader("📈 Relevance Score Distribution")
-    relevance_buckets = {"0.0-0.3": 0, "0.3-0.5": 0, "0.5-0.7": 0, "0.7-1.0": 0}
-    for event in events:
-        if event.relevance_score < 0.3:
-            relevance_buckets["0.0-0.3"] += 1
-        elif event.relevance_score < 0.5:
-            relevance_buckets["0.3-0.5"] += 1
-        elif event.relevance_score < 0.7:
-            relevance_buckets["0.5-0.7"] += 1
-        else:
-            relevance_buckets["0.7-1.0"] += 1
+    st.bar_chart(bundle.relevance_bins)
+
 
-    relevance_data = pd.DataFrame([
-        {"Range": k, "Count": v}
-        for k, v in relevance_buckets.items()
-    ])
-    st.bar_chart(relevance_data.set_index("Range"))
+@st.fragment
+def _render_view(filtered_events: List[EventDTO], storage: SQLiteStorage, query: Dict[str, Any]):
+    """View selector and the selected view (reruns without the page header/filters)."""
+    # View selector
+    view_mode = st.radio(
+        "View Mode",
+        ["📋 List", "📅 Timeline", "📊 Table", "📈 Analytics"],
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+
+    st.divider()
+
+    # Render selected view
+    search_term = query.get("search") or ""
+    if view_mode == "📋 List":
+        render_list_view(filtered_events, storage, search_term)
+    elif view_mode == "📅 Timeline":
+        render_timeline_view(filtered_events, storage, search_term)
+    elif view_mode == "📊 Table":
+        render_table_view(filtered_events, storage)
+    else:  # Analytics
+        render_analytics_view(filtered_events, storage, query)
 
 
 def render_events_page():
     """Main events page - the primary workspace for client intelligence."""
     # Initialize storage
-    storage = SQLiteStorage()
-    storage.connect()
+    storage = get_storage()
 
     # Check if viewing event detail
     if st.session_state.get("viewing_event_id"):
@@ -909,7 +1173,7 @@ def render_events_page():
         if event:
             client = storage.get_client(event.client_id)
             client_name = client.name if client else "Unknown Client"
-            all_events = storage.get_all_events()
+            all_events = _all_events(storage)
             render_event_detail_modal(event, client_name, storage, all_events)
             return
         else:
@@ -917,39 +1181,25 @@ def render_events_page():
             del st.session_state.viewing_event_id
 
     # Normal page view
-    st.markdown('<h1 class="main-header">Event Intelligence</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Your workspace for reviewing and managing client events</p>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-header">Event Intelligence</h1>'
+                '<p class="subtitle">Your workspace for reviewing and managing client events</p>', unsafe_allow_html=True)
 
     # Render filters in sidebar
     filters = render_filters_sidebar(storage)
 
-    # Get all events
-    all_events = storage.get_all_events()
-
-    # Apply filters
-    filtered_events = apply_filters(all_events, filters, storage)
+    # Load matching events; reuse them on reruns that don't touch the filters
+    filter_key = _filters_key(filters)
+    if (st.session_state.get("events_filter_key") != filter_key
+            or time.time() - st.session_state.get("events_loaded_at", 0) > 60):
+        st.session_state.events_query = _filter_query(filters, storage)
+        st.session_state.events_filtered = storage.query_events(**st.session_state.events_query)
+        st.session_state.events_filter_key = filter_key
+        st.session_state.events_loaded_at = time.time()
+    filtered_events = st.session_state.events_filtered
 
     # Quick stats
     render_quick_stats(filtered_events)
 
     st.divider()
 
-    # View selector
-    view_mode = st.radio(
-        "View Mode",
-        ["📋 List", "📅 Timeline", "📊 Table", "📈 Analytics"],
-        horizontal=True,
-        label_visibility="collapsed"
-    )
-
-    st.divider()
-
-    # Render selected view
-    if view_mode == "📋 List":
-        render_list_view(filtered_events, storage, filters.get("search_term", ""))
-    elif view_mode == "📅 Timeline":
-        render_timeline_view(filtered_events, storage)
-    elif view_mode == "📊 Table":
-        render_table_view(filtered_events, storage)
-    else:  # Analytics
-        render_analytics_view(filtered_events, storage)
+    _render_view(filtered_events, storage, st.session_state.events_query)
@@ -6,8 +6,8 @@ from datetime import datetime
 
 def render_help_page():
     """Main help and user guide page."""
-    st.markdown('<h1 class="main-header">📚 Help & User Guide</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Learn how to get the most out of ClientIQ</p>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-header">📚 Help & User Guide</h1>'
+                '<p class="subtitle">Learn how to get the most out of ClientIQ</p>', unsafe_allow_html=True)
 
     # Navigation tabs
     tabs = st.tabs([
@@ -254,8 +254,8 @@ def export_to_csv(events: List[Event], clients_dict: Dict) -> str:
 
 def render_insights_page():
     """Main analytics dashboard page."""
-    st.markdown('<h1 class="main-header">📊 Analytics & Insights</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Data-driven intelligence for executive decision making</p>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-header">📊 Analytics & Insights</h1>'
+                '<p class="subtitle">Data-driven intelligence for executive decision making</p>', unsafe_allow_html=True)
 
     # Initialize storage
     storage = SQLiteStorage()
@@ -5,14 +5,44 @@ Allows visual verification that DTOs work correctly.
 
 import streamlit as st
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
 from src.models import ClientDTO, EventDTO, SearchCacheDTO
 from src.models.utils import (
     format_datetime_ago,
     sentiment_score_to_label,
     relevance_score_to_label,
+    generate_uuid,
+    normalize_relevance_score,
+    normalize_sentiment_score,
 )
 
+# Thresholds the event details show is_relevant() for
+RELEVANCE_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+
+
+# Serialised/validated forms of the samples, keyed on the fields the page's
+# buttons can change so a rerun (e.g. opening an expander) is a cache hit.
+@st.cache_data(show_spinner=False)
+def _client_derived(client_id: str, _client: ClientDTO) -> Tuple[Tuple[bool, Optional[str]], Dict[str, Any], str, str]:
+    """validate(), to_dict(), to_json() and str() of a sample client."""
+    return _client.validate(), _client.to_dict(), _client.to_json(), str(_client)
+
+
+@st.cache_data(show_spinner=False)
+def _event_derived(event_id: str, status: str,
+                   _event: EventDTO) -> Tuple[Tuple[bool, Optional[str]], Dict[str, Any], str, Dict[float, bool]]:
+    """validate(), to_dict(), get_relevance_label() and is_relevant() per threshold of a sample event."""
+    relevant = {t: _event.is_relevant(t) for t in RELEVANCE_THRESHOLDS}
+    return _event.validate(), _event.to_dict(), _event.get_relevance_label(), relevant
+
+
+@st.cache_data(show_spinner=False)
+def _cache_derived(query_hash: str, cached_at: datetime, expires_at: datetime, result_count: int,
+                   _cache: SearchCacheDTO) -> Tuple[Tuple[bool, Optional[str]], Dict[str, Any]]:
+    """validate() and to_dict() of a sample search cache entry."""
+    return _cache.validate(), _cache.to_dict()
+
 
 def render_models_test_page():
     """Render the models testing page."""
@@ -49,12 +79,12 @@ def render_models_test_page():
     st.divider()
 
     # Display Client Sample
-    if hasattr(st.session_state, 'sample_client'):
+    if 'sample_client' in st.session_state:
         st.subheader("🏢 Client Data Model")
         client = st.session_state.sample_client
 
         # Validate
-        is_valid, error = client.validate()
+        (is_valid, error), client_dict, client_json, client_str = _client_derived(client.id, client)
 
         if is_valid:
             st.success("✅ Client model created and validated successfully!")
@@ -85,24 +115,24 @@ def render_models_test_page():
 
         # Show raw JSON
         with st.expander("📄 View Raw JSON"):
-            st.json(client.to_dict())
+            st.json(client_dict)
 
         # Show methods demo
         with st.expander("🔧 Test Methods"):
-            st.code(f"client.to_dict() -> {len(client.to_dict())} fields")
-            st.code(f"client.validate() -> {client.validate()}")
-            st.code(f"client.to_json() -> {len(client.to_json())} characters")
-            st.code(f"str(client) -> {str(client)}")
+            st.code(f"client.to_dict() -> {len(client_dict)} fields")
+            st.code(f"client.validate() -> {(is_valid, error)}")
+            st.code(f"client.to_json() -> {len(client_json)} characters")
+            st.code(f"str(client) -> {client_str}")
 
         st.divider()
 
     # Display Event Sample
-    if hasattr(st.session_state, 'sample_event'):
+    if 'sample_event' in st.session_state:
         st.subheader("📰 Event Data Model")
         event = st.session_state.sample_event
 
         # Validate
-        is_valid, error = event.validate()
+        (is_valid, error), _, relevance_label, relevant = _event_derived(event.id, event.status, event)
 
         if is_valid:
             st.success("✅ Event model created and validated successfully!")
@@ -118,7 +148,6 @@ def render_models_test_page():
                 st.metric("Event Type", event.event_type.replace("_", " ").title())
 
             with col2:
-                relevance_label = event.get_relevance_label()
                 relevance_color = {"high": "🟢", "medium": "🟡", "low": "🔴"}
                 st.metric("Relevance", f"{relevance_color.get(relevance_label, '')} {relevance_label.title()}")
 
@@ -148,11 +177,9 @@ def render_models_test_page():
 
         # Test relevance checking
         with st.expander("🎯 Test Relevance Checking"):
-            thresholds = [0.3, 0.5, 0.7, 0.9]
             st.markdown("**Test `is_relevant()` method:**")
 
-            for threshold in thresholds:
-                is_relevant = event.is_relevant(threshold)
+            for threshold, is_relevant in relevant.items():
                 icon = "✅" if is_relevant else "❌"
                 st.markdown(f"{icon} `event.is_relevant({threshold})` → {is_relevant}")
 
@@ -179,17 +206,18 @@ def render_models_test_page():
 
         # Show raw JSON
         with st.expander("📄 View Raw JSON"):
-            st.json(event.to_dict())
+            st.json(_event_derived(event.id, event.status, event)[1])
 
         st.divider()
 
     # Display Cache Sample
-    if hasattr(st.session_state, 'sample_cache'):
+    if 'sample_cache' in st.session_state:
         st.subheader("💾 Search Cache Data Model")
         cache = st.session_state.sample_cache
 
         # Validate
-        is_valid, error = cache.validate()
+        (is_valid, error), _ = _cache_derived(cache.query_hash, cache.cached_at, cache.expires_at,
+                                              cache.result_count, cache)
 
         if is_valid:
             st.success("✅ Cache model created and validated successfully!")
@@ -256,7 +284,8 @@ def render_models_test_page():
 
         # Show raw JSON
         with st.expander("📄 View Raw JSON"):
-            st.json(cache.to_dict())
+            st.json(_cache_derived(cache.query_hash, cache.cached_at, cache.expires_at,
+                                   cache.result_count, cache)[1])
 
         st.divider()
 
@@ -264,12 +293,6 @@ def render_models_test_page():
     st.subheader("🛠️ Utility Functions Demo")
 
     with st.expander("🔧 Test Utility Functions"):
-        from src.models.utils import (
-            generate_uuid,
-            normalize_relevance_score,
-            normalize_sentiment_score,
-        )
-
         st.markdown("**UUID Generation:**")
         col1, col2 = st.columns(2)
         with col1:
@@ -298,7 +321,6 @@ def render_models_test_page():
                 st.code(f"{val} → {normalized}")
 
         st.markdown("**Time Formatting:**")
-        from datetime import timedelta
         now = datetime.utcnow()
         test_times = [
             now - timedelta(seconds=30),
@@ -315,12 +337,8 @@ def render_models_test_page():
     # Clear All Button
     st.divider()
     if st.button("🗑️ Clear All Samples", type="secondary"):
-        if hasattr(st.session_state, 'sample_client'):
-            del st.session_state.sample_client
-        if hasattr(st.session_state, 'sample_event'):
-            del st.session_state.sample_event
-        if hasattr(st.session_state, 'sample_cache'):
-            del st.session_state.sample_cache
+        for key in ("sample_client", "sample_event", "sample_cache"):
+            st.session_state.pop(key, None)
         st.rerun()
 
 
@@ -404,8 +404,8 @@ def render_notification_history(storage: SQLiteStorage):
 
 def render_notifications_page():
     """Main notifications management page."""
-    st.markdown('<h1 class="main-header">📬 Notification Rules</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Configure automated alerts and track notification history</p>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-header">📬 Notification Rules</h1>'
+                '<p class="subtitle">Configure automated alerts and track notification history</p>', unsafe_allow_html=True)
 
     # Initialize storage
     storage = SQLiteStorage()
@@ -491,7 +491,7 @@ def render_notifications_page():
                 st.metric("Total Rules", len(rules))
 
             with col2:
-                active_count = len([r for r in rules if r.is_active])
+                active_count = sum(1 for r in rules if r.is_active)
                 st.metric("Active", active_count)
 
             with col3:
@@ -499,7 +499,7 @@ def render_notifications_page():
                 st.metric("Total Triggers", total_triggers)
 
             with col4:
-                recent = len([r for r in rules if r.last_triggered and (datetime.utcnow() - r.last_triggered).days < 7])
+                recent = sum(1 for r in rules if r.last_triggered and (datetime.utcnow() - r.last_triggered).days < 7)
                 st.metric("Active (7d)", recent)
 
     # === History Tab ===
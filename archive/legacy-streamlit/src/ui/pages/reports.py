@@ -770,8 +770,8 @@ def render_email_settings():
 
 def render_reports_page():
     """Main reports and digest generation page."""
-    st.markdown('<h1 class="main-header">📊 Reports & Digests</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Generate intelligence reports and send digests</p>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-header">📊 Reports & Digests</h1>'
+                '<p class="subtitle">Generate intelligence reports and send digests</p>', unsafe_allow_html=True)
 
     # Initialize
     storage = SQLiteStorage()
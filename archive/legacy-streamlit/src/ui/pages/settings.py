@@ -625,8 +625,8 @@ def render_display_settings():
 
 def render_settings_page():
     """Main settings page."""
-    st.markdown('<h1 class="main-header">⚙️ Settings</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Configure application settings and preferences</p>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-header">⚙️ Settings</h1>'
+                '<p class="subtitle">Configure application settings and preferences</p>', unsafe_allow_html=True)
 
     # Initialize settings
     initialize_settings()
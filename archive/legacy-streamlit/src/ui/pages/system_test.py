@@ -379,8 +379,8 @@ def clear_sample_data() -> Tuple[bool, str]:
 
 def render_system_test_page():
     """Main system test page."""
-    st.markdown('<h1 class="main-header">🧪 System Testing & Diagnostics</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="subtitle">Health checks, test suites, and sample data generation</p>', unsafe_allow_html=True)
+    st.markdown('<h1 class="main-header">🧪 System Testing & Diagnostics</h1>'
+                '<p class="subtitle">Health checks, test suites, and sample data generation</p>', unsafe_allow_html=True)
 
     # System Health Check
     st.markdown("## 🏥 System Health Check")
@@ -11,8 +11,13 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 import sqlite3
+from contextlib import closing
 from config import settings
 
+# PRAGMA user_version recorded once the status column exists
+SCHEMA_VERSION = 1
+
+
 def migrate_database():
     """Add status column to events table if it doesn't exist."""
     db_path = settings.database_url.replace("sqlite:///", "")
@@ -21,44 +26,56 @@ def migrate_database():
     print("=" * 60)
 
     try:
-        # Connect to database
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Check if events table exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='events'
-        """)
-
-        if not cursor.fetchone():
-            print("[INFO] Events table doesn't exist yet. No migration needed.")
-            return
-
-        # Check if status column exists
-        cursor.execute("PRAGMA table_info(events)")
-        columns = [row[1] for row in cursor.fetchall()]
-
-        if "status" in columns:
-            print("[OK] Status column already exists. No migration needed.")
-        else:
-            print("[INFO] Adding 'status' column to events table...")
-
+        # Autocommit connection; the migration manages its own transaction and
+        # the inner "with conn" rolls it back if anything fails
+        with closing(sqlite3.connect(db_path, isolation_level=None)) as conn, conn:
+            cursor = conn.cursor()
+
+            # Settings for this connection only; the database file's journal
+            # mode is left as the app configured it
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+
+            # Schema version 1 means the status column is already in place
+            cursor.execute("PRAGMA user_version")
+            if cursor.fetchone()[0] >= SCHEMA_VERSION:
+                print("[OK] Status column already exists. No migration needed.")
+                return
+
+            # Check if events table exists
             cursor.execute("""
-                ALTER TABLE events
-                ADD COLUMN status TEXT NOT NULL DEFAULT 'new'
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name='events'
             """)
 
-            conn.commit()
-            print("[OK] Successfully added 'status' column!")
-            print("[OK] All existing events will have status='new'")
+            if not cursor.fetchone():
+                print("[INFO] Events table doesn't exist yet. No migration needed.")
+                return
 
-        print("\n" + "=" * 60)
-        print("[SUCCESS] Migration complete!")
-        print("\nNext steps:")
-        print("1. Refresh your browser (Ctrl+R or Cmd+R)")
-        print("2. Navigate to the Database page")
-        print("3. The page should now load without errors")
+            # Add the column and record the version in one transaction
+            print("[INFO] Adding 'status' column to events table...")
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute("""
+                    ALTER TABLE events
+                    ADD COLUMN status TEXT NOT NULL DEFAULT 'new'
+                """)
+                print("[OK] Successfully added 'status' column!")
+                print("[OK] All existing events will have status='new'")
+            except sqlite3.OperationalError as e:
+                if "duplicate column" not in str(e):
+                    raise
+                print("[OK] Status column already exists. No migration needed.")
+
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            cursor.execute("COMMIT")
+
+            print("\n" + "=" * 60)
+            print("[SUCCESS] Migration complete!")
+            print("\nNext steps:")
+            print("1. Refresh your browser (Ctrl+R or Cmd+R)")
+            print("2. Navigate to the Database page")
+            print("3. The page should now load without errors")
 
     except sqlite3.Error as e:
         print(f"[ERROR] Database error: {e}")
@@ -66,9 +83,6 @@ def migrate_database():
     except Exception as e:
         print(f"[ERROR] Unexpected error: {e}")
         return 1
-    finally:
-        if conn:
-            conn.close()
 
     return 0
 
@@ -3,6 +3,7 @@ Comprehensive database migration script.
 Migrates from old SQLAlchemy schema to new DTO-based schema.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -13,6 +14,80 @@ sys.path.insert(0, str(project_root))
 import sqlite3
 from config import settings
 
+# Old event categories and the event_type each maps to; anything else is 'other'
+CATEGORY_MAP = [
+    ("FUNDING", "funding"),
+    ("ACQUISITION", "acquisition"),
+    ("LEADERSHIP", "leadership"),
+    ("PRODUCT", "product"),
+    ("NEWS", "news"),
+]
+
+# Columns added to each table, in order:
+# (column, source column it requires or None, column definition,
+#  [(column the backfill needs or None, backfill value expression), ...])
+# Backfills of columns without a default only fill values still NULL; columns
+# with a default are never NULL, so only sentiment needs a real backfill.
+MIGRATIONS = [
+    ("events", [
+        ("status", None, "TEXT NOT NULL DEFAULT 'new'", []),
+        ("published_date", "event_date", "TEXT", [
+            (None, "COALESCE(published_date, event_date)"),
+        ]),
+        ("discovered_date", "discovered_at", "TEXT", [
+            (None, "COALESCE(discovered_date, discovered_at)"),
+        ]),
+        ("event_type", None, "TEXT", [
+            ("category", """COALESCE(
+                event_type,
+                (SELECT new FROM category_map WHERE old = events.category),
+                'other'
+            )"""),
+            (None, "COALESCE(event_type, 'news')"),
+        ]),
+        ("summary", "description", "TEXT", [
+            (None, "COALESCE(summary, description)"),
+        ]),
+        ("source_url", "url", "TEXT", [
+            (None, "COALESCE(source_url, url)"),
+        ]),
+        ("source_name", "source", "TEXT", [
+            (None, "COALESCE(source_name, source)"),
+        ]),
+        ("sentiment", None, "TEXT DEFAULT 'neutral'", [
+            ("sentiment_score", """CASE
+                WHEN sentiment_score >= 0.3 THEN 'positive'
+                WHEN sentiment_score <= -0.3 THEN 'negative'
+                ELSE 'neutral'
+            END"""),
+        ]),
+        ("tags", None, "TEXT DEFAULT '[]'", []),
+        ("metadata", None, "TEXT DEFAULT '{}'", []),
+    ]),
+    ("clients", [
+        ("priority", None, "TEXT NOT NULL DEFAULT 'medium'", []),
+        ("keywords", "search_keywords", "TEXT", [
+            (None, "COALESCE(keywords, search_keywords)"),
+        ]),
+        ("monitoring_since", "created_at", "TEXT", [
+            (None, "COALESCE(monitoring_since, created_at)"),
+        ]),
+        ("last_checked", "last_checked_at", "TEXT", [
+            (None, "COALESCE(last_checked, last_checked_at)"),
+        ]),
+        ("metadata", None, "TEXT DEFAULT '{}'", []),
+    ]),
+]
+
+
+# Indexes created once the columns are in place: (name, table, column specs)
+INDEXES = [
+    ("idx_events_client_url", "events", ["client_id", "source_url"]),
+    ("idx_events_client_pub", "events", ["client_id", "published_date DESC"]),
+    ("idx_events_status", "events", ["status"]),
+]
+
+
 def migrate_database():
     """Migrate database schema from old to new format."""
     db_path = settings.database_url.replace("sqlite:///", "")
@@ -21,10 +96,18 @@ def migrate_database():
     print("=" * 60)
 
     try:
-        # Connect to database
-        conn = sqlite3.connect(db_path)
+        # Connect in autocommit mode; the migration runs as one explicit transaction
+        conn = sqlite3.connect(db_path, isolation_level=None)
         cursor = conn.cursor()
 
+        # Settings for this connection only; the database file's journal
+        # mode is left as the app configured it
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MB for the full-table UPDATEs
+        # Map just the current file for the backfill reads; reset once migrated
+        cursor.execute(f"PRAGMA mmap_size={os.path.getsize(db_path)}")
+
         # Check if events table exists
         cursor.execute("""
             SELECT name FROM sqlite_master
@@ -36,217 +119,72 @@ def migrate_database():
             conn.close()
             return 0
 
-        # Get current columns
-        cursor.execute("PRAGMA table_info(events)")
-        columns = {row[1]: row[2] for row in cursor.fetchall()}
-        print(f"[INFO] Found {len(columns)} columns in events table")
-
+        # Work out every statement the migration needs from the current schema,
+        # then run them all as one script
+        sql_parts = []
         migrations_applied = []
-
-        # Migration 1: Add status column
-        if "status" not in columns:
-            print("[MIGRATE] Adding 'status' column...")
-            cursor.execute("""
-                ALTER TABLE events
-                ADD COLUMN status TEXT NOT NULL DEFAULT 'new'
-            """)
-            migrations_applied.append("status")
-
-        # Migration 2: Add published_date (map from event_date)
-        if "published_date" not in columns and "event_date" in columns:
-            print("[MIGRATE] Adding 'published_date' column (mapping from event_date)...")
-            cursor.execute("""
-                ALTER TABLE events
-                ADD COLUMN published_date TEXT
-            """)
-            # Copy data from event_date to published_date
-            cursor.execute("""
-                UPDATE events
-                SET published_date = event_date
-            """)
-            migrations_applied.append("published_date")
-
-        # Migration 3: Add discovered_date (map from discovered_at)
-        if "discovered_date" not in columns and "discovered_at" in columns:
-            print("[MIGRATE] Adding 'discovered_date' column (mapping from discovered_at)...")
-            cursor.execute("""
-                ALTER TABLE events
-                ADD COLUMN discovered_date TEXT
-            """)
-            # Copy data from discovered_at to discovered_date
-            cursor.execute("""
-                UPDATE events
-                SET discovered_date = discovered_at
-            """)
-            migrations_applied.append("discovered_date")
-
-        # Migration 4: Add event_type (default to category for now)
-        if "event_type" not in columns:
-            print("[MIGRATE] Adding 'event_type' column...")
-            cursor.execute("""
-                ALTER TABLE events
-                ADD COLUMN event_type TEXT
-            """)
-            # Map from category if it exists
-            if "category" in columns:
-                cursor.execute("""
-                    UPDATE events
-                    SET event_type = CASE
-                        WHEN category = 'FUNDING' THEN 'funding'
-                        WHEN category = 'ACQUISITION' THEN 'acquisition'
-                        WHEN category = 'LEADERSHIP' THEN 'leadership'
-                        WHEN category = 'PRODUCT' THEN 'product'
-                        WHEN category = 'NEWS' THEN 'news'
-                        ELSE 'other'
-                    END
-                """)
-            else:
-                cursor.execute("UPDATE events SET event_type = 'news'")
-            migrations_applied.append("event_type")
-
-        # Migration 5: Add summary (map from description)
-        if "summary" not in columns and "description" in columns:
-            print("[MIGRATE] Adding 'summary' column (mapping from description)...")
-            cursor.execute("""
-                ALTER TABLE events
-                ADD COLUMN summary TEXT
-            """)
-            cursor.execute("""
-                UPDATE events
-                SET summary = description
-            """)
-            migrations_applied.append("summary")
-
-        # Migration 6: Add source_url (map from url)
-        if "source_url" not in columns and "url" in columns:
-            print("[MIGRATE] Adding 'source_url' column (mapping from url)...")
-            cursor.execute("""
-                ALTER TABLE events
-                ADD COLUMN source_url TEXT
-            """)
-            cursor.execute("""
-                UPDATE events
-                SET source_url = url
-            """)
-            migrations_applied.append("source_url")
-
-        # Migration 7: Add source_name (map from source)
-        if "source_name" not in columns and "source" in columns:
-            print("[MIGRATE] Adding 'source_name' column (mapping from source)...")
-            cursor.execute("""
-                ALTER TABLE events
-                ADD COLUMN source_name TEXT
-            """)
-            cursor.execute("""
-                UPDATE events
-                SET source_name = source
-            """)
-            migrations_applied.append("source_name")
-
-        # Migration 8: Add sentiment (derive from sentiment_score)
-        if "sentiment" not in columns:
-            print("[MIGRATE] Adding 'sentiment' column...")
-            cursor.execute("""
-                ALTER TABLE events
-                ADD COLUMN sentiment TEXT DEFAULT 'neutral'
-            """)
-            if "sentiment_score" in columns:
-                cursor.execute("""
-                    UPDATE events
-                    SET sentiment = CASE
-                        WHEN sentiment_score >= 0.3 THEN 'positive'
-                        WHEN sentiment_score <= -0.3 THEN 'negative'
-                        ELSE 'neutral'
-                    END
-                """)
-            migrations_applied.append("sentiment")
-
-        # Migration 9: Add tags column (empty JSON array)
-        if "tags" not in columns:
-            print("[MIGRATE] Adding 'tags' column...")
-            cursor.execute("""
-                ALTER TABLE events
-                ADD COLUMN tags TEXT DEFAULT '[]'
-            """)
-            cursor.execute("UPDATE events SET tags = '[]' WHERE tags IS NULL")
-            migrations_applied.append("tags")
-
-        # Migration 10: Add metadata column (empty JSON object)
-        if "metadata" not in columns:
-            print("[MIGRATE] Adding 'metadata' column...")
-            cursor.execute("""
-                ALTER TABLE events
-                ADD COLUMN metadata TEXT DEFAULT '{}'
-            """)
-            cursor.execute("UPDATE events SET metadata = '{}' WHERE metadata IS NULL")
-            migrations_applied.append("metadata")
-
-        # ==================== Migrate Clients Table ====================
-
-        # Get clients table columns
-        cursor.execute("PRAGMA table_info(clients)")
-        client_columns = {row[1]: row[2] for row in cursor.fetchall()}
-
-        # Migration 11: Add priority column to clients
-        if "priority" not in client_columns:
-            print("[MIGRATE] Adding 'priority' column to clients table...")
-            cursor.execute("""
-                ALTER TABLE clients
-                ADD COLUMN priority TEXT NOT NULL DEFAULT 'medium'
-            """)
-            migrations_applied.append("clients.priority")
-
-        # Migration 12: Add keywords column to clients (map from search_keywords)
-        if "keywords" not in client_columns and "search_keywords" in client_columns:
-            print("[MIGRATE] Adding 'keywords' column to clients table...")
-            cursor.execute("""
-                ALTER TABLE clients
-                ADD COLUMN keywords TEXT
-            """)
-            cursor.execute("""
-                UPDATE clients
-                SET keywords = search_keywords
-            """)
-            migrations_applied.append("clients.keywords")
-
-        # Migration 13: Add monitoring_since column to clients (map from created_at)
-        if "monitoring_since" not in client_columns and "created_at" in client_columns:
-            print("[MIGRATE] Adding 'monitoring_since' column to clients table...")
-            cursor.execute("""
-                ALTER TABLE clients
-                ADD COLUMN monitoring_since TEXT
-            """)
-            cursor.execute("""
-                UPDATE clients
-                SET monitoring_since = created_at
-            """)
-            migrations_applied.append("clients.monitoring_since")
-
-        # Migration 14: Add last_checked column to clients (map from last_checked_at)
-        if "last_checked" not in client_columns and "last_checked_at" in client_columns:
-            print("[MIGRATE] Adding 'last_checked' column to clients table...")
-            cursor.execute("""
-                ALTER TABLE clients
-                ADD COLUMN last_checked TEXT
-            """)
-            cursor.execute("""
-                UPDATE clients
-                SET last_checked = last_checked_at
-            """)
-            migrations_applied.append("clients.last_checked")
-
-        # Migration 15: Add metadata column to clients
-        if "metadata" not in client_columns:
-            print("[MIGRATE] Adding 'metadata' column to clients table...")
-            cursor.execute("""
-                ALTER TABLE clients
-                ADD COLUMN metadata TEXT DEFAULT '{}'
-            """)
-            cursor.execute("UPDATE clients SET metadata = '{}' WHERE metadata IS NULL")
-            migrations_applied.append("clients.metadata")
-
-        # Commit all changes
-        conn.commit()
+        table_columns = {}
+        for table, migrations in MIGRATIONS:
+            # Get current columns and row count once per table
+            cursor.execute(f"PRAGMA table_info({table})")
+            columns = {row[1]: row[2] for row in cursor.fetchall()}
+            if table == "events":
+                print(f"[INFO] Found {len(columns)} columns in events table")
+            row_count = cursor.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            table_columns[table] = set(columns)
+
+            assignments = []
+            for column, source, definition, backfills in migrations:
+                if column in columns or (source and source not in columns):
+                    continue
+
+                if table == "events":
+                    mapping = f" (mapping from {source})" if source else ""
+                    print(f"[MIGRATE] Adding '{column}' column{mapping}...")
+                else:
+                    print(f"[MIGRATE] Adding '{column}' column to {table} table...")
+                sql_parts.append(f"ALTER TABLE {table} ADD COLUMN {column} {definition};")
+                table_columns[table].add(column)
+
+                # Backfill with the first expression whose source column exists
+                for required, value in backfills:
+                    if required is None or required in columns:
+                        assignments.append(f"{column} = {value}")
+                        break
+
+                migrations_applied.append(column if table == "events" else f"{table}.{column}")
+
+            # All of a table's backfills share one UPDATE, so the table is
+            # rewritten once; an empty table has nothing to backfill
+            if assignments and row_count:
+                sql_parts.append(f"UPDATE {table} SET {', '.join(assignments)};")
+
+        # Create missing indexes whose columns will all exist
+        for name, table, column_specs in INDEXES:
+            cursor.execute(f"PRAGMA index_list({table})")
+            indexes = {row[1] for row in cursor.fetchall()}
+            if name not in indexes and all(spec.split()[0] in table_columns[table] for spec in column_specs):
+                print(f"[MIGRATE] Creating index '{name}' on {table}...")
+                sql_parts.append(f"CREATE INDEX {name} ON {table}({', '.join(column_specs)});")
+                migrations_applied.append(f"index {name}")
+
+        if sql_parts:
+            # Lookup table for the event_type backfill
+            category_rows = ", ".join(f"('{old}', '{new}')" for old, new in CATEGORY_MAP)
+            sql_parts[:0] = [
+                "CREATE TEMP TABLE category_map(old TEXT PRIMARY KEY, new TEXT);",
+                f"INSERT INTO category_map VALUES {category_rows};",
+            ]
+
+            # Refresh the query planner's statistics for the new columns and indexes
+            sql_parts.append("ANALYZE;")
+
+            # All migrations commit (or roll back) together
+            cursor.executescript("BEGIN IMMEDIATE;\n" + "\n".join(sql_parts) + "\nCOMMIT;")
+            cursor.execute("PRAGMA mmap_size=0")
+
+            # Let SQLite refresh any other statistics the new schema needs
+            cursor.execute("PRAGMA optimize")
 
         print("\n" + "=" * 60)
         if migrations_applied:
@@ -2,9 +2,12 @@
 
 import sys
 import os
+from functools import lru_cache
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, List, Tuple
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == "win32":
@@ -23,8 +26,13 @@ from src.processors.relevance_scorer import update_event_relevance
 from src.processors.deduplicator import filter_duplicates
 from src.models.event_dto import EventDTO
 
+# Searches are network-bound, so collectors that declare themselves
+# thread-safe run them on a small thread pool; all others run serially
+SEARCH_WORKERS = 8
 
-def generate_search_queries(client_name: str) -> List[str]:
+
+@lru_cache(maxsize=None)
+def generate_search_queries(client_name: str) -> Tuple[str, ...]:
     """
     Generate search queries for a client.
 
@@ -32,20 +40,29 @@ def generate_search_queries(client_name: str) -> List[str]:
         client_name: Name of the client
 
     Returns:
-        List of search queries
+        Tuple of search queries (cached per client name)
     """
     # Base queries
-    queries = [
+    queries = (
         client_name,  # Just the name
         f"{client_name} funding",
         f"{client_name} acquisition",
         f"{client_name} partnership",
         f"{client_name} product launch",
-    ]
+    )
 
     return queries
 
 
+def _remaining_searches(collector):
+    """Searches the collector's rate limit still allows, or None if unlimited/unknown."""
+    if not hasattr(collector, 'get_rate_limit_status'):
+        return None
+    status = collector.get_rate_limit_status()
+    remaining = status.get('remaining', status.get('remaining_calls'))
+    return remaining if isinstance(remaining, int) else None
+
+
 def run_monitoring(
     lookback_days: int = 7,
     min_relevance_score: float = 0.6,
@@ -85,31 +102,60 @@ def run_monitoring(
     total_duplicates = 0
     total_low_relevance = 0
 
+    # One search window for the whole scan
+    from_date = datetime.utcnow() - timedelta(days=lookback_days)
+
+    # Each distinct query is searched once, however many clients share it
+    client_queries = {client.id: generate_search_queries(client.name) for client in active_clients}
+    query_results: Dict[str, List] = {
+        query: [] for queries in client_queries.values() for query in queries
+    }
+
+    # Only schedule the searches the collector's rate limit still allows;
+    # the rest are skipped and left with no results
+    scheduled = list(query_results)
+    remaining = _remaining_searches(collector)
+    if remaining is not None and len(scheduled) > remaining:
+        print(f"[WARN] Rate limit allows {max(remaining, 0)} of {len(scheduled)} searches; skipping the rest")
+        scheduled = scheduled[:max(remaining, 0)]
+
+    workers = SEARCH_WORKERS if getattr(collector, 'thread_safe', False) else 1
+    print(f"[SEARCH] Running {len(scheduled)} searches on {workers} worker(s)...")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                collector.search,
+                query=query,
+                from_date=from_date,
+                max_results=max_results_per_query
+            ): query
+            for query in scheduled
+        }
+        for future in as_completed(futures):
+            query = futures[future]
+            try:
+                query_results[query] = future.result()
+                total_searched += 1
+            except Exception as e:
+                print(f"  [ERROR] Error searching '{query}': {e}")
+
+    # Fan the results back out to each client, in query order
+    results_by_client: Dict[str, List] = {
+        client_id: list(chain.from_iterable(query_results[query] for query in queries))
+        for client_id, queries in client_queries.items()
+    }
+
     # Process each client
+    checked_ids: List[str] = []
     for i, client in enumerate(active_clients, 1):
         print(f"\n[{i}/{len(active_clients)}] Processing: {client.name}")
         print("-" * 40)
 
-        # Generate queries
-        queries = generate_search_queries(client.name)
-        print(f"  [SEARCH] Searching with {len(queries)} queries...")
-
         # Get existing events for deduplication
         existing_events = storage.get_events_by_client(client.id)
 
-        # Collect results from all queries
-        all_results = []
-        for query in queries:
-            try:
-                results = collector.search(
-                    query=query,
-                    from_date=datetime.utcnow() - timedelta(days=lookback_days),
-                    max_results=max_results_per_query
-                )
-                all_results.extend(results)
-                total_searched += 1
-            except Exception as e:
-                print(f"  [ERROR] Error searching '{query}': {e}")
+        # Results gathered by the search pool
+        all_results = results_by_client[client.id]
 
         print(f"  [RESULTS] Found {len(all_results)} raw results")
         total_found += len(all_results)
@@ -129,28 +175,38 @@ def run_monitoring(
             else:
                 total_low_relevance += 1
 
-        # Filter duplicates
-        unique_events = filter_duplicates(new_events, existing_events)
+        # Filter duplicates: URLs already stored for the client are checked in
+        # SQL, then titles against the most recent events
+        new_urls = storage.filter_new_urls(client.id, [e.source_url for e in new_events if e.source_url])
+        unique_events = filter_duplicates(
+            [e for e in new_events if not e.source_url or e.source_url in new_urls],
+            existing_events
+        )
         duplicates_found = len(new_events) - len(unique_events)
         total_duplicates += duplicates_found
 
         print(f"  [SAVED] New events: {len(unique_events)} (filtered {duplicates_found} duplicates)")
 
-        # Save events
-        for event in unique_events:
-            try:
-                storage.create_event(event)
-                total_new += 1
-            except Exception as e:
-                print(f"  [ERROR] Error saving event: {e}")
-
-        # Update client last_checked
+        # Save events in one transaction; fall back to one at a time so a bad
+        # event doesn't cost the rest of the batch
         try:
-            storage.update_client(client.id, {
-                'last_checked': datetime.utcnow()
-            })
-        except Exception as e:
-            print(f"  [WARNING] Error updating client: {e}")
+            storage.create_events_bulk(unique_events)
+            total_new += len(unique_events)
+        except Exception:
+            for event in unique_events:
+                try:
+                    storage.create_event(event)
+                    total_new += 1
+                except Exception as e:
+                    print(f"  [ERROR] Error saving event: {e}")
+
+        checked_ids.append(client.id)
+
+    # Update last_checked for every processed client in one statement
+    try:
+        storage.bulk_update_client_last_checked(checked_ids, datetime.utcnow())
+    except Exception as e:
+        print(f"[WARNING] Error updating clients: {e}")
 
     # Print summary
     print("\n" + "=" * 60)
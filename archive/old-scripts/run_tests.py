@@ -10,15 +10,23 @@ import subprocess
 import argparse
 from pathlib import Path
 
+import pytest
 
-def run_command(cmd: list[str], description: str) -> int:
-    """Run a command and return the exit code."""
+
+def run_command(cmd: list[str], description: str, isolated: bool = False) -> int:
+    """Run a pytest command and return the exit code.
+
+    pytest runs in this process unless ``isolated`` is set, which starts a
+    fresh interpreter instead.
+    """
     print(f"\n{'='*60}")
     print(f"{description}")
     print(f"{'='*60}\n")
 
-    result = subprocess.run(cmd)
-    return result.returncode
+    if isolated:
+        result = subprocess.run(cmd)
+        return result.returncode
+    return int(pytest.main(cmd[1:]))
 
 
 def main():
@@ -50,11 +58,29 @@ def main():
         help="Run tests matching keyword"
     )
 
+    parser.add_argument(
+        "--no-parallel",
+        action="store_true",
+        help="Run tests in a single process instead of across CPU cores"
+    )
+
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run pytest in a subprocess instead of in this process"
+    )
+
     args = parser.parse_args()
 
     # Base pytest command
     pytest_cmd = ["pytest"]
 
+    # Spread tests across CPU cores with pytest-xdist; --dist=loadfile keeps
+    # each file on one worker so fixtures sharing files don't collide.
+    # Coverage and integration runs stay in one process.
+    if not args.no_parallel and args.suite not in ("coverage", "integration"):
+        pytest_cmd.extend(["-n", "auto", "--dist=loadfile"])
+
     if args.verbose:
         pytest_cmd.append("-v")
 
@@ -98,7 +124,7 @@ def main():
         description += f" (keyword: {args.keyword})"
 
     # Run the tests
-    exit_code = run_command(pytest_cmd, description)
+    exit_code = run_command(pytest_cmd, description, isolated=args.isolated)
 
     # Print summary
     print(f"\n{'='*60}")
@@ -11,7 +11,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from datetime import datetime, timedelta
-import random
+import numpy as np
 from src.storage import Database, ClientRepository, EventRepository
 from src.collectors import MockCollector
 from src.models import EventCategory
@@ -71,11 +71,20 @@ def create_sample_clients(session):
     return clients
 
 
+def _relevance_range(category):
+    """Relevance score range for a mock event (high for important categories)."""
+    if category in [EventCategory.FUNDING.value, EventCategory.ACQUISITION.value]:
+        return 0.7, 1.0
+    if category in [EventCategory.LEADERSHIP_CHANGE.value, EventCategory.PRODUCT_LAUNCH.value]:
+        return 0.5, 0.8
+    return 0.3, 0.6
+
+
 def create_sample_events(session, clients):
     """Create sample events using MockCollector."""
     collector = MockCollector(seed=42)  # Fixed seed for reproducible data
 
-    total_events = 0
+    events = []
 
     for client in clients:
         # Get mock news for this client
@@ -86,42 +95,38 @@ def create_sample_events(session, clients):
         )
 
         for result in results:
-            # Determine category from mock data
-            category = result.raw_data.get("category", EventCategory.OTHER.value)
-
-            # Generate relevance score (mock: high for important categories)
-            if category in [EventCategory.FUNDING.value, EventCategory.ACQUISITION.value]:
-                relevance_score = random.uniform(0.7, 1.0)
-            elif category in [EventCategory.LEADERSHIP_CHANGE.value, EventCategory.PRODUCT_LAUNCH.value]:
-                relevance_score = random.uniform(0.5, 0.8)
-            else:
-                relevance_score = random.uniform(0.3, 0.6)
-
-            # Generate sentiment score
-            sentiment_score = random.uniform(-0.3, 0.8)  # Mostly positive news
-
-            # Create event
-            event = EventRepository.create(
-                session,
+            # Queue event; random scores are filled in below
+            events.append(dict(
                 client_id=client.id,
                 title=result.title,
                 description=result.description,
                 url=result.url,
                 source=result.source,
-                category=category,
-                relevance_score=relevance_score,
-                sentiment_score=sentiment_score,
+                category=result.raw_data.get("category", EventCategory.OTHER.value),
                 event_date=result.published_at,
-                is_read=random.choice([True, False]),  # Some already read
-            )
-            total_events += 1
+            ))
 
         # Update client's last_checked_at
         ClientRepository.mark_as_checked(session, client.id)
 
         print(f"[OK] Created {len(results)} events for {client.name}")
 
-    return total_events
+    # Draw every event's random scores in one go
+    rng = np.random.default_rng(42)
+    low, high = np.array([_relevance_range(event["category"]) for event in events]).reshape(-1, 2).T
+    relevance_scores = rng.uniform(low, high)
+    sentiment_scores = rng.uniform(-0.3, 0.8, size=len(events))  # Mostly positive news
+    is_read = rng.random(len(events)) < 0.5  # Some already read
+
+    for event, relevance_score, sentiment_score, read in zip(
+        events, relevance_scores.tolist(), sentiment_scores.tolist(), is_read.tolist()
+    ):
+        event.update(relevance_score=relevance_score, sentiment_score=sentiment_score, is_read=read)
+
+    # Insert all events in one flush
+    EventRepository.create_many(session, events)
+
+    return len(events)
 
 
 def main():
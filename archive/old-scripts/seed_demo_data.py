@@ -426,76 +426,78 @@ def seed_demo_data(num_clients: int = 18, num_events: int = 75):
     storage = SQLiteStorage()
     storage.connect()
 
-    # Create clients
-    print("📊 Creating clients...")
-    clients = []
-    num_clients = min(num_clients, len(SAMPLE_COMPANIES))
-
-    for i in range(num_clients):
-        company_data = SAMPLE_COMPANIES[i]
-
-        client = ClientDTO(
-            id=f"demo_{company_data['name'].lower().replace(' ', '_')}_{uuid.uuid4().hex[:8]}",
-            name=company_data["name"],
-            industry=company_data["industry"],
-            domain=company_data["domain"],
-            description=company_data["description"],
-            tier=company_data["tier"],
-            account_owner=company_data["account_owner"],
-            keywords=company_data["keywords"],
-            is_active=True,
-            priority="high" if company_data["tier"] == "Enterprise" else "medium"
-        )
-
-        storage.create_client(client)
-        clients.append(client)
-        print(f"   ✓ {client.name} ({client.industry})")
-
-    print(f"\n✅ Created {len(clients)} clients")
-    print()
-
-    # Create events distributed across clients and time
-    print("📰 Creating events...")
-
-    # Event type distribution (realistic)
-    event_type_weights = {
-        "product": 0.25,      # 25% product launches/updates
-        "partnership": 0.20,  # 20% partnerships
-        "funding": 0.15,      # 15% funding news
-        "leadership": 0.15,   # 15% leadership changes
-        "financial": 0.10,    # 10% financial results
-        "acquisition": 0.08,  # 8% acquisitions
-        "award": 0.05,        # 5% awards
-        "regulatory": 0.02    # 2% regulatory
-    }
+    # Insert every client and event in one transaction
+    with storage.transaction():
+        # Create clients
+        print("📊 Creating clients...")
+        clients = []
+        num_clients = min(num_clients, len(SAMPLE_COMPANIES))
+
+        for i in range(num_clients):
+            company_data = SAMPLE_COMPANIES[i]
+
+            client = ClientDTO(
+                id=f"demo_{company_data['name'].lower().replace(' ', '_')}_{uuid.uuid4().hex[:8]}",
+                name=company_data["name"],
+                industry=company_data["industry"],
+                domain=company_data["domain"],
+                description=company_data["description"],
+                tier=company_data["tier"],
+                account_owner=company_data["account_owner"],
+                keywords=company_data["keywords"],
+                is_active=True,
+                priority="high" if company_data["tier"] == "Enterprise" else "medium"
+            )
+
+            storage.create_client(client)
+            clients.append(client)
+            print(f"   ✓ {client.name} ({client.industry})")
+
+        print(f"\n✅ Created {len(clients)} clients")
+        print()
+
+        # Create events distributed across clients and time
+        print("📰 Creating events...")
+
+        # Event type distribution (realistic)
+        event_type_weights = {
+            "product": 0.25,      # 25% product launches/updates
+            "partnership": 0.20,  # 20% partnerships
+            "funding": 0.15,      # 15% funding news
+            "leadership": 0.15,   # 15% leadership changes
+            "financial": 0.10,    # 10% financial results
+            "acquisition": 0.08,  # 8% acquisitions
+            "award": 0.05,        # 5% awards
+            "regulatory": 0.02    # 2% regulatory
+        }
 
-    event_types = list(event_type_weights.keys())
-    weights = list(event_type_weights.values())
+        event_types = list(event_type_weights.keys())
+        weights = list(event_type_weights.values())
 
-    events_created = 0
-    target_events_per_client = num_events // len(clients)
+        events_created = 0
+        target_events_per_client = num_events // len(clients)
 
-    for client in clients:
-        # Each client gets 3-6 events
-        num_client_events = random.randint(
-            max(2, target_events_per_client - 2),
-            min(8, target_events_per_client + 2)
-        )
+        for client in clients:
+            # Each client gets 3-6 events
+            num_client_events = random.randint(
+                max(2, target_events_per_client - 2),
+                min(8, target_events_per_client + 2)
+            )
 
-        for _ in range(num_client_events):
-            # Select event type based on weights
-            event_type = random.choices(event_types, weights=weights)[0]
+            for _ in range(num_client_events):
+                # Select event type based on weights
+                event_type = random.choices(event_types, weights=weights)[0]
 
-            # Distribute events over last 30 days
-            days_ago = random.randint(0, 30)
+                # Distribute events over last 30 days
+                days_ago = random.randint(0, 30)
 
-            event = generate_event_from_template(client, event_type, days_ago)
-            if event:
-                storage.create_event(event)
-                events_created += 1
+                event = generate_event_from_template(client, event_type, days_ago)
+                if event:
+                    storage.create_event(event)
+                    events_created += 1
 
-                if events_created % 10 == 0:
-                    print(f"   Created {events_created} events...")
+                    if events_created % 10 == 0:
+                        print(f"   Created {events_created} events...")
 
     print(f"\n✅ Created {events_created} events")
     print()
@@ -526,10 +528,11 @@ def clear_demo_data():
     all_clients = storage.get_all_clients()
     deleted_count = 0
 
-    for client in all_clients:
-        if client.id.startswith('demo_'):
-            storage.delete_client(client.id)
-            deleted_count += 1
+    with storage.transaction():
+        for client in all_clients:
+            if client.id.startswith('demo_'):
+                storage.delete_client(client.id)
+                deleted_count += 1
 
     print(f"✅ Deleted {deleted_count} demo clients and their events")
 
@@ -99,6 +99,18 @@ class TestClientCRUD:
         assert len(active_clients) == 1
         assert active_clients[0].id == "active-1"
 
+    def test_get_clients_by_ids(self, populated_storage):
+        """Test batch-retrieving clients by ID."""
+        clients = populated_storage.get_clients_by_ids(
+            ["test-client-1", "test-client-2", "non-existent-id"]
+        )
+
+        assert {c.id for c in clients} == {"test-client-1", "test-client-2"}
+
+    def test_get_clients_by_ids_empty(self, test_storage):
+        """Test batch retrieval with no IDs returns an empty list."""
+        assert test_storage.get_clients_by_ids([]) == []
+
     def test_update_client(self, test_storage, sample_client_dto):
         """Test updating a client."""
         test_storage.create_client(sample_client_dto)
@@ -143,6 +155,20 @@ class TestClientCRUD:
         assert len(results) >= 1
         assert any("Acme" in c.name for c in results)
 
+    def test_bulk_update_client_last_checked(self, test_storage, multiple_client_dtos):
+        """Test setting last_checked on several clients at once."""
+        for client in multiple_client_dtos:
+            test_storage.create_client(client)
+
+        checked_at = datetime(2024, 1, 15, 12, 0, 0)
+        ids = [c.id for c in multiple_client_dtos[:2]]
+        updated = test_storage.bulk_update_client_last_checked(ids + ["non-existent-id"], checked_at)
+
+        assert updated == 2
+        for client_id in ids:
+            assert test_storage.get_client(client_id).last_checked == checked_at
+        assert test_storage.bulk_update_client_last_checked([], checked_at) == 0
+
     def test_search_clients_no_results(self, test_storage, multiple_client_dtos):
         """Test searching with no matches."""
         for client in multiple_client_dtos:
@@ -179,11 +205,112 @@ class TestEventCRUD:
         assert retrieved_event.id == sample_event_dto.id
         assert retrieved_event.title == sample_event_dto.title
 
+    def test_create_events_bulk(self, test_storage, sample_client_dto, event_factory):
+        """Test creating several events in one call."""
+        test_storage.create_client(sample_client_dto)
+        events = [event_factory(id=f"bulk-{i}", client_id=sample_client_dto.id, title=f"Event {i}") for i in range(3)]
+
+        created = test_storage.create_events_bulk(events)
+
+        assert [e.id for e in created] == [e.id for e in events]
+        assert len(test_storage.get_events_by_ids([e.id for e in events])) == 3
+
+    def test_create_events_bulk_invalid_writes_nothing(self, test_storage, sample_client_dto, event_factory):
+        """Test that one invalid event rejects the whole batch."""
+        test_storage.create_client(sample_client_dto)
+        events = [event_factory(id=f"bulk-{i}", client_id=sample_client_dto.id) for i in range(2)]
+        events[1].relevance_score = 2.0
+
+        with pytest.raises(ValueError):
+            test_storage.create_events_bulk(events)
+
+        assert test_storage.get_all_events() == []
+
     def test_get_event_not_found(self, test_storage):
         """Test retrieving a non-existent event returns None."""
         result = test_storage.get_event("non-existent-id")
         assert result is None
 
+    def test_query_events_filters(self, populated_storage):
+        """Test that query_events applies every filter in SQL."""
+        all_events = populated_storage.get_all_events()
+        target = all_events[0]
+
+        events = populated_storage.query_events(
+            search=target.title[:5].upper(),
+            client_ids=[target.client_id],
+            event_types=[target.event_type],
+            statuses=[target.status],
+            min_relevance=target.relevance_score,
+        )
+
+        assert target.id in [e.id for e in events]
+        assert all(e.client_id == target.client_id for e in events)
+        assert all(e.relevance_score >= target.relevance_score for e in events)
+        assert populated_storage.query_events(client_ids=[]) == []
+        assert len(populated_storage.query_events()) == len(all_events)
+
+    def test_query_events_search_is_literal(self, test_storage, client_factory, event_factory):
+        """Test that LIKE wildcards in the search term are matched literally."""
+        test_storage.create_client(client_factory(id="test-client"))
+        test_storage.create_event(event_factory(id="percent", title="Revenue up 50% this year"))
+        test_storage.create_event(event_factory(id="plain", title="Revenue up this year",
+                                                source_url="https://example.com/plain"))
+
+        assert [e.id for e in test_storage.query_events(search="%")] == ["percent"]
+        assert test_storage.query_events(search="_") == []
+
+    def test_query_events_search_folds_unicode_case(self, test_storage, client_factory, event_factory):
+        """Test that search folds the case of non-ASCII letters too."""
+        test_storage.create_client(client_factory(id="test-client"))
+        test_storage.create_event(event_factory(id="accented", title="ÉCOLE opens new campus"))
+        test_storage.create_event(event_factory(id="plain", title="Ecole opens new campus",
+                                                source_url="https://example.com/plain"))
+
+        assert [e.id for e in test_storage.query_events(search="é")] == ["accented"]
+        assert [e.id for e in test_storage.query_events(search="École")] == ["accented"]
+
+    def test_top_clients_by_events(self, populated_storage):
+        """Test per-client event counts are grouped by client name in SQL."""
+        events = populated_storage.get_all_events()
+        names = {c.id: c.name for c in populated_storage.get_all_clients(active_only=False)}
+        expected = {}
+        for e in events:
+            if e.client_id in names:
+                expected[names[e.client_id]] = expected.get(names[e.client_id], 0) + 1
+
+        top = populated_storage.top_clients_by_events()
+
+        assert dict(top) == expected
+        assert [count for _, count in top] == sorted(expected.values(), reverse=True)
+        assert populated_storage.top_clients_by_events(client_ids=[]) == []
+
+    def test_top_sources_by_events(self, populated_storage):
+        """Test per-source event counts honour the limit and filters."""
+        events = populated_storage.get_all_events()
+        target = events[0]
+
+        top = populated_storage.top_sources_by_events(limit=1)
+        filtered = populated_storage.top_sources_by_events(client_ids=[target.client_id])
+
+        assert len(top) == 1
+        assert sum(count for _, count in filtered) == sum(
+            1 for e in events if e.client_id == target.client_id and e.source_name
+        )
+
+    def test_get_events_by_ids(self, populated_storage):
+        """Test batch-retrieving events by ID keeps the requested order."""
+        ids = [e.id for e in populated_storage.get_all_events()]
+        requested = list(reversed(ids)) + ["non-existent-id"]
+
+        events = populated_storage.get_events_by_ids(requested)
+
+        assert [e.id for e in events] == list(reversed(ids))
+
+    def test_get_events_by_ids_empty(self, test_storage):
+        """Test batch retrieval with no IDs returns an empty list."""
+        assert test_storage.get_events_by_ids([]) == []
+
     def test_get_events_by_client(self, populated_storage):
         """Test retrieving events for a specific client."""
         events = populated_storage.get_events_by_client("test-client-1")
@@ -253,6 +380,41 @@ class TestEventCRUD:
         assert len(results) >= 1
         assert all(e.client_id == "test-client-1" for e in results)
 
+    def test_filter_new_urls(self, test_storage, sample_client_dto, event_factory):
+        """Test that only URLs not already stored for the client are returned."""
+        test_storage.create_client(sample_client_dto)
+        test_storage.create_event(event_factory(
+            id="stored", client_id=sample_client_dto.id, source_url="https://example.com/stored"
+        ))
+
+        new_urls = test_storage.filter_new_urls(
+            sample_client_dto.id, ["https://example.com/stored", "https://example.com/new"]
+        )
+
+        assert new_urls == {"https://example.com/new"}
+        assert test_storage.filter_new_urls("other-client", ["https://example.com/stored"]) == {
+            "https://example.com/stored"
+        }
+        assert test_storage.filter_new_urls(sample_client_dto.id, []) == set()
+
+    def test_bulk_update_event_status(self, populated_storage):
+        """Test updating the status of several events at once."""
+        ids = [e.id for e in populated_storage.get_all_events()][:2]
+
+        updated = populated_storage.bulk_update_event_status(ids, "archived")
+
+        assert updated == 2
+        assert all(populated_storage.get_event(i).status == "archived" for i in ids)
+
+    def test_bulk_delete_events(self, populated_storage):
+        """Test deleting several events at once."""
+        ids = [e.id for e in populated_storage.get_all_events()][:2]
+
+        deleted = populated_storage.bulk_delete_events(ids + ["non-existent-id"])
+
+        assert deleted == 2
+        assert populated_storage.get_events_by_ids(ids) == []
+
 
 # ==================== Statistics Tests ====================
 
@@ -297,6 +459,71 @@ class TestStatistics:
         assert len(info["tables"]) > 0
 
 
+# ==================== Job Run Tests ====================
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestJobRuns:
+    """Tests for job run queries."""
+
+    def _create_runs(self, storage):
+        from src.models.job_run import JobRun
+
+        base = datetime.now()
+        specs = [
+            ("daily_scan", "completed"),
+            ("daily_scan", "failed"),
+            ("weekly_report", "completed"),
+            ("cache_cleanup", "completed"),
+        ]
+        for i, (job_name, status) in enumerate(specs):
+            storage.create_job_run(JobRun(
+                id=f"run-{i}",
+                job_name=job_name,
+                start_time=base - timedelta(minutes=i),
+                status=status,
+            ))
+
+    def test_get_recent_job_runs_filters_in_sql(self, test_storage):
+        """Test filtering job runs by name and status."""
+        self._create_runs(test_storage)
+
+        runs = test_storage.get_recent_job_runs(
+            limit=10,
+            job_names=["daily_scan", "weekly_report"],
+            statuses=["completed"],
+        )
+
+        assert [r.id for r in runs] == ["run-0", "run-2"]
+
+    def test_get_recent_job_runs_limit_applies_after_filter(self, test_storage):
+        """Test that LIMIT does not truncate matching runs before filtering."""
+        self._create_runs(test_storage)
+
+        runs = test_storage.get_recent_job_runs(limit=1, job_names=["cache_cleanup"])
+
+        assert [r.id for r in runs] == ["run-3"]
+
+    def test_job_runs_indexes_created(self, test_storage):
+        """Test that job run filter/order indexes exist."""
+        with test_storage.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='index' AND tbl_name='job_runs'
+            """)
+            indexes = {row[0] for row in cursor.fetchall()}
+
+        assert "idx_job_runs_start" in indexes
+        assert "idx_job_runs_status_job" in indexes
+
+    def test_get_recent_job_runs_empty_filter(self, test_storage):
+        """Test that an empty filter list matches nothing."""
+        self._create_runs(test_storage)
+
+        assert test_storage.get_recent_job_runs(statuses=[]) == []
+
+
 # ==================== Cascade Delete Tests ====================
 
 @pytest.mark.unit
@@ -339,6 +566,28 @@ class TestTransactions:
         all_clients = test_storage.get_all_clients(active_only=False)
         assert len(all_clients) == 1
 
+    def test_transaction_commits_together(self, test_storage, client_factory, event_factory):
+        """Test that calls inside transaction() are committed when it exits."""
+        with test_storage.transaction():
+            test_storage.create_client(client_factory(id="tx-1"))
+            test_storage.create_event(event_factory(id="tx-event", client_id="tx-1"))
+            assert test_storage._connection.in_transaction
+
+        assert not test_storage._connection.in_transaction
+        assert test_storage.get_client("tx-1") is not None
+        assert test_storage.get_event("tx-event") is not None
+
+    def test_transaction_rolls_back_on_error(self, test_storage, client_factory):
+        """Test that an error inside transaction() rolls back every call in it."""
+        with pytest.raises(RuntimeError):
+            with test_storage.transaction():
+                test_storage.create_client(client_factory(id="tx-1"))
+                with test_storage.transaction():
+                    test_storage.create_client(client_factory(id="tx-2"))
+                raise RuntimeError("boom")
+
+        assert test_storage.get_all_clients(active_only=False) == []
+
 
 # ==================== Edge Cases ====================
 